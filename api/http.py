@@ -2,65 +2,120 @@
 from __future__ import annotations
 import asyncio
 import random
-from typing import Any, Dict, Optional, Union, TYPE_CHECKING
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Union, TYPE_CHECKING
 import aiohttp
+import orjson
 from models import APIError
 
 if TYPE_CHECKING:
     from aiohttp import ClientResponse, ClientSession
 
 DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10)  # seconds
+DEFAULT_MAX_CONCURRENCY = 8  # in-flight requests per client
+DNS_CACHE_TTL = 300  # seconds to reuse a resolved api.isthereanydeal.com address
+TARGET_LATENCY = 2.0  # seconds; slower responses count as backpressure
+MAX_RETRY_AFTER = 30.0  # never sleep longer than this for a 429
+
+# Friendlier messages for common gateway failures
+_SERVER_ERROR_MESSAGES: Dict[int, str] = {
+    502: "API service temporarily unavailable (Bad Gateway)",
+    503: "API service temporarily unavailable (Service Unavailable)",
+    504: "API request timed out (Gateway Timeout)",
+}
+
+class AIMDLimiter:
+    """
+    Adaptive cap on in-flight requests.
+
+    The limit grows additively while responses stay under the target latency
+    and halves on throttling (429), timeouts or slow responses.
+    """
+
+    def __init__(self, maximum: int, *, minimum: int = 1, target_latency: float = TARGET_LATENCY, window: int = 20) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.limit: float = float(maximum)
+        self._in_flight = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()  # the limit may have grown, not just freed a slot
+
+    def record(self, latency: float, *, throttled: bool = False) -> None:
+        """Feed back one response and adjust the limit"""
+        self._latencies.append(latency)
+        average = sum(self._latencies) / len(self._latencies)
+        if throttled or average > self.target_latency:
+            self.limit = max(self.minimum, self.limit * 0.5)
+        else:
+            self.limit = min(self.maximum, self.limit + 0.5)
+
+
+def _retry_after(headers: Any, default: float) -> float:
+    """Seconds to wait from a Retry-After header, falling back to default"""
+    try:
+        return min(float(headers.get('Retry-After')), MAX_RETRY_AFTER)
+    except (AttributeError, TypeError, ValueError):
+        return default
+
 
 class HttpClient:
-    def __init__(self, *, headers: Optional[Dict[str, str]] = None, timeout: Optional[aiohttp.ClientTimeout] = None) -> None:
-        self._session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, *, headers: Optional[Dict[str, str]] = None, timeout: Optional[aiohttp.ClientTimeout] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, session: Optional[aiohttp.ClientSession] = None, connector: Optional[aiohttp.BaseConnector] = None) -> None:
+        # A passed-in session or connector is borrowed: reused for requests but never closed here
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session: bool = session is None
+        self._connector: Optional[aiohttp.BaseConnector] = connector
         self._headers: Dict[str, str] = headers or {}
         self._timeout: aiohttp.ClientTimeout = timeout or DEFAULT_TIMEOUT
+        self._limiter = AIMDLimiter(max_concurrency)  # Keep bursts from overflowing the pool or tripping rate limits
 
     @property
     def session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout, headers=self._headers)
+            connector = self._connector or aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=DNS_CACHE_TTL)
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                headers=self._headers,
+                connector=connector,
+                connector_owner=self._connector is None
+            )
+            self._owns_session = True
         return self._session
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
     async def get_json(self, url: str, *, params: Optional[Dict[str, Any]] = None, retries: int = 3) -> Any:
         delay: float = 0.5
         for attempt in range(1, retries + 1):
             try:
-                async with self.session.get(url, params=params) as resp:
-                    # Handle server errors with better messages
-                    if resp.status >= 500:
-                        error_msg = f"Server error {resp.status}"
-                        if resp.status == 502:
-                            error_msg = "API service temporarily unavailable (Bad Gateway)"
-                        elif resp.status == 503:
-                            error_msg = "API service temporarily unavailable (Service Unavailable)"
-                        elif resp.status == 504:
-                            error_msg = "API request timed out (Gateway Timeout)"
-                        raise aiohttp.ClientResponseError(resp.request_info, resp.history, status=resp.status, message=error_msg)
-                    
-                    resp.raise_for_status()
-                    
-                    # Check content type before parsing JSON
-                    if 'application/json' not in resp.content_type:
-                        text_content = await resp.text()
-                        if resp.status == 200 and not text_content.strip():
-                            raise ValueError("API returned empty response")
-                        raise ValueError(f"API returned non-JSON content (Content-Type: {resp.content_type})")
-                    
-                    json_data = await resp.json()
-                    
-                    # Handle case where JSON parsing returns None (empty response)
-                    if json_data is None:
-                        raise ValueError("API returned null/empty JSON response")
-                        
-                    return json_data
-                    
+                async with self._limiter:
+                    started = time.monotonic()
+                    try:
+                        async with self.session.get(url, params=params) as resp:
+                            self._limiter.record(time.monotonic() - started, throttled=resp.status == 429)
+                            return await self._parse_json(resp)
+                    except asyncio.TimeoutError:
+                        self._limiter.record(time.monotonic() - started, throttled=True)
+                        raise
             except aiohttp.ClientResponseError as e:
+                if e.status == 429 and attempt < retries:
+                    # Rate limited: wait as long as the server asks, plus jitter
+                    await asyncio.sleep(_retry_after(e.headers, delay) + random.uniform(0, 0.25))
+                    delay = min(delay * 2, 4.0)
+                    continue
                 if 400 <= e.status < 500:
                     raise  # don't retry client errors
                 # For server errors, retry with backoff
@@ -75,3 +130,28 @@ class HttpClient:
             except ValueError as e:
                 # Don't retry JSON parsing errors or empty responses
                 raise
+
+    async def _parse_json(self, resp: ClientResponse) -> Any:
+        # Handle server errors with better messages
+        if resp.status >= 500:
+            error_msg = _SERVER_ERROR_MESSAGES.get(resp.status) or f"Server error {resp.status}"
+            raise aiohttp.ClientResponseError(resp.request_info, resp.history, status=resp.status, message=error_msg)
+        
+        resp.raise_for_status()
+        
+        # Check content type before parsing JSON
+        if 'application/json' not in resp.content_type:
+            text_content = await resp.text()
+            if resp.status == 200 and not text_content.strip():
+                raise ValueError("API returned empty response")
+            raise ValueError(f"API returned non-JSON content (Content-Type: {resp.content_type})")
+        
+        # Decode the raw bytes with orjson (skips aiohttp's str decode step)
+        body = await resp.read()
+        json_data = orjson.loads(body) if body.strip() else None
+        
+        # Handle case where JSON parsing returns None (empty response)
+        if json_data is None:
+            raise ValueError("API returned null/empty JSON response")
+            
+        return json_data
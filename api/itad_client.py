@@ -11,22 +11,68 @@ from typing import List, Dict, Any, Optional, Union, Tuple, Literal
 import aiohttp
 import logging
 import os
+import orjson
 from .http import HttpClient
+from config.logging_config import SamplingFilter
 from models import Deal, ITADGameItem, StoreFilter, APIError
 from utils.game_filters import PriorityGameFilter
+from utils.deal_cache import DealCache
 from utils.itad_quality import ITADQualityFilter, EnhancedAssetFlipDetector
 from .store_mapping import StoreMapper
 from .priority_deals import PriorityDealsClient, PriorityMethod
 
+# Per-deal messages fire for every item in a response, so only keep a sample
+deal_log = logging.getLogger('GameDealer.deals')
+deal_log.addFilter(SamplingFilter(10))
+
+FETCH_CACHE_TTL = 60  # seconds; deals rotate, so keep identical-query reuse short
+
+API_LOG_DIR = "logs"
+API_LOG_FILE = os.path.join(API_LOG_DIR, "api_responses.jsonl")  # one JSON entry per line
+_LEGACY_API_LOG_FILE = os.path.join(API_LOG_DIR, "api_responses.json")
+_LEGACY_SEPARATOR = "=" * 50
+_legacy_log_checked = False
+
+
+def _migrate_legacy_api_log() -> None:
+    """Convert an old api_responses.json into JSONL once, so appends stay O(1)"""
+    global _legacy_log_checked
+    if _legacy_log_checked:
+        return
+    _legacy_log_checked = True
+    if not os.path.exists(_LEGACY_API_LOG_FILE) or os.path.exists(API_LOG_FILE):
+        return
+    try:
+        with open(_LEGACY_API_LOG_FILE, "rb") as f:
+            content = f.read()
+        try:
+            # Older clients wrote a single JSON list
+            entries = orjson.loads(content)
+            if not isinstance(entries, list):
+                entries = [entries]
+        except orjson.JSONDecodeError:
+            # Otherwise indented objects separated by a row of '='
+            chunks = content.decode("utf-8").split(_LEGACY_SEPARATOR)
+            entries = [orjson.loads(chunk) for chunk in chunks if chunk.strip()]
+        with open(API_LOG_FILE, "wb") as f:
+            for entry in entries:
+                f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+        # Keep the original around rather than deleting it
+        os.replace(_LEGACY_API_LOG_FILE, _LEGACY_API_LOG_FILE + ".bak")
+        logging.info(f"Migrated {len(entries)} entries from {_LEGACY_API_LOG_FILE} to {API_LOG_FILE} (original kept as .bak)")
+    except Exception as e:
+        logging.warning(f"Could not migrate legacy API response log: {e}")
+
 class ITADClient:
     """Client for IsThereAnyDeal API with type safety and error handling"""
     BASE: str = "https://api.isthereanydeal.com"
 
-    def __init__(self, api_key: Optional[str] = None, http: Optional[HttpClient] = None) -> None:
+    def __init__(self, api_key: Optional[str] = None, http: Optional[HttpClient] = None, session: Optional[aiohttp.ClientSession] = None, connector: Optional[aiohttp.BaseConnector] = None) -> None:
         headers = {}
-        self.http = http or HttpClient(headers=headers)
+        self.http = http or HttpClient(headers=headers, session=session, connector=connector)
         self.api_key = api_key
         self.priority_filter = PriorityGameFilter()
+        self._deal_cache = DealCache(cache_duration=FETCH_CACHE_TTL)
         
         # Initialize quality filtering system
         self.quality_filter = ITADQualityFilter(api_key) if api_key else None
@@ -42,6 +88,10 @@ class ITADClient:
     async def close(self) -> None:
         await self.http.close()
 
+    def invalidate(self) -> None:
+        """Drop cached fetch_deals results so the next call hits the API"""
+        self._deal_cache.clear()
+
     async def fetch_deals(
         self, 
         *, 
@@ -59,13 +109,23 @@ class ITADClient:
             min_discount: Minimum discount percentage (default: 60)
             limit: Maximum number of deals to return (default: 10)
             store_filter: Filter by specific store name (e.g. "Steam", "Epic Game Store") 
-            log_full_response: Whether to log full API response to api_responses.json
+            log_full_response: Whether to log full API response to api_responses.jsonl
             quality_filter: Whether to filter for priority games only (default: True)
             min_priority: Minimum priority score for games (1-10, default: 5)
         """
         if not self.api_key:
             raise ValueError("ITAD API key is required")
         
+        # Identical queries within the TTL reuse the processed list; logging
+        # requests always go to the API so the response can be written out
+        cache_key = (min_discount, limit, store_filter, quality_filter, min_priority)
+        if not log_full_response:
+            cached = self._deal_cache.get(cache_key)
+            if cached is not None:
+                logging.info(f"fetch_deals cache HIT: {cache_key}")
+                return list(cached)
+            logging.info(f"fetch_deals cache MISS: {cache_key}")
+        
         logging.info(f"Fetching deals: discount>={min_discount}%, limit={limit}, store={store_filter}")
         
         try:
@@ -138,6 +198,7 @@ class ITADClient:
                         "store": store,
                         "url": url,
                         "discount": f"{discount_pct}%" if discount_pct else None,
+                        "discount_pct": discount_pct or 0,
                         "original_price": prices["original"]
                     }
                     
@@ -148,7 +209,8 @@ class ITADClient:
                     continue
             
             logging.info(f"Processed {len(deals)} deals from {len(data['list'])} API results")
-            return deals
+            self._deal_cache.set(cache_key, deals)
+            return list(deals)
             
         except Exception as e:
             logging.error(f"Failed to fetch deals: {e}")
@@ -233,7 +295,7 @@ class ITADClient:
                     
                     # Asset flip detection
                     if self.asset_flip_detector.is_likely_asset_flip(title, store):
-                        logging.debug(f"Filtered out potential asset flip: {title}")
+                        deal_log.debug("Filtered out potential asset flip: %s", title)
                         continue
                     
                     prices = self._get_prices_v2(item)
@@ -245,6 +307,7 @@ class ITADClient:
                         "store": store,
                         "url": url,
                         "discount": f"{discount_pct}%" if discount_pct else None,
+                        "discount_pct": discount_pct or 0,
                         "original_price": prices["original"]
                     }
                     
@@ -377,16 +440,13 @@ class ITADClient:
             }
             
             # Ensure logs directory exists
-            logs_dir = "logs"
-            if not os.path.exists(logs_dir):
-                os.makedirs(logs_dir)
+            os.makedirs(API_LOG_DIR, exist_ok=True)
+            _migrate_legacy_api_log()
             
-            # Append to log file
-            import json
-            log_file = os.path.join(logs_dir, "api_responses.json")
-            with open(log_file, "a", encoding="utf-8") as f:
-                json.dump(log_entry, f, indent=2, ensure_ascii=False)
-                f.write("\n" + "="*50 + "\n")
+            # Append a single line rather than rewriting earlier entries
+            log_file = API_LOG_FILE
+            with open(log_file, "ab", buffering=0) as f:
+                f.write(orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
             
             logging.info(f"Full API response logged to {log_file}")
             
@@ -5,7 +5,7 @@ Native priority and popularity-based deal fetching for ITAD API
 from __future__ import annotations
 from typing import List, Dict, Any, Optional, Literal
 import logging
-from models import Deal, ITADGameItem
+from models import Deal, ITADGameItem, deal_discount
 from .http import HttpClient
 from .quality_scoring import QualityScorer
 from .store_mapping import StoreMapper
@@ -145,6 +145,7 @@ class PriorityDealsClient:
                         "store": store,
                         "url": url,
                         "discount": f"{discount_pct}%" if discount_pct else None,
+                        "discount_pct": discount_pct or 0,
                         "original_price": prices["original"]
                     }
                     
@@ -282,6 +283,7 @@ class PriorityDealsClient:
                     "store": store,
                     "url": url,
                     "discount": f"{discount_pct}%" if discount_pct else None,
+                    "discount_pct": discount_pct or 0,
                     "original_price": prices["original"],
                 }
                 
@@ -296,7 +298,7 @@ class PriorityDealsClient:
         matched_deals.sort(
             key=lambda x: (
                 x.get("_popularity_score", 0),  # Primary: popularity
-                int(x.get("discount", "0%").replace("%", "")) if x.get("discount") else 0,  # Secondary: discount
+                deal_discount(x),  # Secondary: discount
                 -x.get("_popularity_position", 999)  # Tertiary: position (lower is better)
             ),
             reverse=True
@@ -312,6 +314,7 @@ class PriorityDealsClient:
                 "store": deal_dict["store"],
                 "url": deal_dict["url"],
                 "discount": deal_dict.get("discount"),
+                "discount_pct": deal_dict.get("discount_pct", 0),
                 "original_price": deal_dict.get("original_price")
             }
             final_deals.append(clean_deal)
@@ -468,6 +471,7 @@ class PriorityDealsClient:
                         "store": store,
                         "url": url,
                         "discount": f"{discount_pct}%" if discount_pct else None,
+                        "discount_pct": discount_pct or 0,
                         "original_price": prices["original"]
                     }
                     
@@ -538,6 +542,7 @@ class PriorityDealsClient:
                         "store": store,
                         "url": url,
                         "discount": f"{discount_pct}%" if discount_pct else None,
+                        "discount_pct": discount_pct or 0,
                         "original_price": prices["original"]
                     }
                     
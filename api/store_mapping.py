@@ -2,9 +2,29 @@
 """
 Store filtering and shop ID mapping functionality for ITAD API
 """
-from typing import Union, Optional, Dict
+from typing import Union, Optional, Dict, Tuple
 from models import StoreFilter
 
+# Common aliases for each store, keyed by canonical lowercase name
+_FILTER_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "epic game store": ("epic", "epic games"),
+    "gog.com": ("gog",),
+    "humble store": ("humble", "humble bundle"),
+    "green man gaming": ("gmg",),
+    "ubisoft connect": ("uplay", "ubisoft store"),
+    "battle.net": ("blizzard",),
+    "microsoft store": ("xbox",),
+    "playstation store": ("psn",),
+    "nintendo eshop": ("nintendo",)
+}
+
+# Every accepted lowercase spelling -> its canonical store, built once
+_STORE_GROUPS: Dict[str, str] = {
+    name: canonical
+    for canonical, aliases in _FILTER_ALIASES.items()
+    for name in (canonical, *aliases)
+}
+
 class StoreMapper:
     """Handles store name to shop ID mapping and filtering"""
     
@@ -91,27 +111,9 @@ class StoreMapper:
         if normalized_store == normalized_filter:
             return True
         
-        # Check common aliases
-        store_aliases = {
-            "epic game store": ["epic", "epic games"],
-            "gog.com": ["gog"],
-            "humble store": ["humble", "humble bundle"],
-            "green man gaming": ["gmg"],
-            "ubisoft connect": ["uplay", "ubisoft store"],
-            "battle.net": ["blizzard"],
-            "microsoft store": ["xbox"],
-            "playstation store": ["psn"],
-            "nintendo eshop": ["nintendo"]
-        }
-        
-        # Check if filter matches any aliases for this store
-        for canonical_name, aliases in store_aliases.items():
-            if normalized_store == canonical_name:
-                return normalized_filter in aliases or normalized_filter == canonical_name
-            elif normalized_store in aliases:
-                return normalized_filter == canonical_name or normalized_filter in aliases
-        
-        return False
+        # Otherwise both names must belong to the same alias group
+        group = _STORE_GROUPS.get(normalized_store)
+        return group is not None and _STORE_GROUPS.get(normalized_filter) == group
     
     @classmethod
     def get_available_stores(cls) -> list[str]:
@@ -3,7 +3,8 @@ from __future__ import annotations
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional, List, TYPE_CHECKING
+from aiolimiter import AsyncLimiter
+from typing import Optional, List, Dict, TYPE_CHECKING
 import logging
 from utils.embeds import make_startup_embed
 from api.itad_client import ITADClient
@@ -32,6 +33,32 @@ class GameDealerBot(commands.Bot):
         if itad_api_key:
             self.itad_client = ITADClient(api_key=itad_api_key)
 
+        # Outbound message limiters keyed by channel ID
+        self._send_buckets: Dict[int, AsyncLimiter] = {}
+        # Resolved channel handles keyed by channel ID
+        self._channel_cache: Dict[int, discord.abc.Messageable] = {}
+
+    def channel_limiter(self, channel_id: int) -> AsyncLimiter:
+        """Get the send limiter for a channel (Discord allows 5 messages per 5s)"""
+        limiter = self._send_buckets.get(channel_id)
+        if limiter is None:
+            limiter = self._send_buckets[channel_id] = AsyncLimiter(5, 5)
+        return limiter
+
+    async def resolve_channel(self, channel_id: int) -> discord.abc.Messageable:
+        """Get a channel by ID, falling back to a REST fetch only on first use"""
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.get_channel(channel_id)
+            if channel is None:
+                channel = await self.fetch_channel(channel_id)
+            self._channel_cache[channel_id] = channel
+        return channel
+
+    def forget_channel(self, channel_id: int) -> None:
+        """Drop a cached channel handle (e.g. after the channel was deleted)"""
+        self._channel_cache.pop(channel_id, None)
+
     async def setup_hook(self) -> None:
         """Initialize bot setup with proper error handling"""
         # Load cogs with individual error handling
@@ -88,14 +88,17 @@ class SchedulerCommands(commands.Cog):
         self.bot = bot
         self.log = getattr(bot, 'log', logging.getLogger(__name__))
         self.scheduler = DealScheduler(bot, self.log)
+        self._tasks: set[asyncio.Task] = set()  # Keep background tasks referenced until done
         
     async def cog_load(self):
         """Start scheduler when cog loads"""
         self.scheduler.start_scheduler()
     
     async def cog_unload(self):
-        """Stop scheduler when cog unloads"""
+        """Stop scheduler and cancel any triggered fetches still running"""
         self.scheduler.stop_scheduler()
+        for task in self._tasks:
+            task.cancel()
     
     @commands.command()
     @commands.has_permissions(administrator=True)
@@ -116,8 +119,18 @@ class SchedulerCommands(commands.Cog):
     async def trigger_daily_deals(self, ctx):
         """Manually trigger daily deal posting"""
         await ctx.send("🔄 Triggering daily deal fetch...")
-        await self.scheduler.daily_deals()
-        await ctx.send("✅ Daily deal fetch completed")
+        task = asyncio.create_task(self._run_triggered_deals(ctx))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_triggered_deals(self, ctx):
+        """Run a manually triggered deal fetch in the background"""
+        # Runs outside the command, so failures never reach on_command_error
+        try:
+            await self.scheduler.daily_deals()
+            await ctx.send("✅ Daily deal fetch completed")
+        except Exception as e:
+            self.log.error(f"Error in triggered daily deal fetch: {e}")
 
 async def setup(bot):
     await bot.add_cog(SchedulerCommands(bot))
\ No newline at end of file
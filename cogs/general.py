@@ -2,7 +2,8 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from utils.embeds import make_startup_embed
+from models import Deal
+from utils.embeds import make_startup_embed, make_deal_embed
 
 class General(commands.Cog):
     """Essential utility commands for GameDealer bot"""
@@ -30,14 +31,12 @@ class General(commands.Cog):
                 self.log.warning("LOG_CHANNEL_ID not set; skipping startup message.")
             return
 
-        channel = self.bot.get_channel(self.log_channel_id)
-        if channel is None:
-            try:
-                channel = await self.bot.fetch_channel(self.log_channel_id)
-            except Exception as e:
-                if self.log:
-                    self.log.error(f"Could not fetch channel {self.log_channel_id}: {e}")
-                return
+        try:
+            channel = await self.bot.resolve_channel(self.log_channel_id)
+        except Exception as e:
+            if self.log:
+                self.log.error(f"Could not fetch channel {self.log_channel_id}: {e}")
+            return
 
         try:
             await channel.send(embed=make_startup_embed(self.bot.user))
@@ -50,6 +49,33 @@ class General(commands.Cog):
             if self.log:
                 self.log.exception(f"Failed to send startup message: {e}")
 
+    # --- deal posting ---
+    async def send_deal_to_discord(self, deal: Deal) -> bool:
+        """Post a single deal to the deals channel"""
+        channel_id = getattr(self.bot, 'deals_channel_id', 0) or self.log_channel_id
+        if not channel_id:
+            if self.log:
+                self.log.warning("DEALS_CHANNEL_ID not set; cannot post deal.")
+            return False
+
+        try:
+            channel = await self.bot.resolve_channel(channel_id)
+            async with self.bot.channel_limiter(channel_id):
+                await channel.send(embed=make_deal_embed(deal))
+            return True
+        except discord.NotFound:
+            # Channel was deleted; resolve it again next time
+            self.bot.forget_channel(channel_id)
+            if self.log:
+                self.log.error(f"Deals channel {channel_id} not found.")
+        except discord.Forbidden:
+            if self.log:
+                self.log.error("Missing permissions to send messages in the deals channel.")
+        except Exception as e:
+            if self.log:
+                self.log.exception(f"Failed to send deal: {e}")
+        return False
+
     # --- essential commands ---
     @app_commands.command(name="ping", description="Test bot responsiveness")
     async def ping(self, interaction: discord.Interaction):
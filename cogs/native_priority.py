@@ -6,14 +6,34 @@ Uses ITAD's native API endpoints for priority searching without local JSON datab
 """
 
 import logging
+from types import MappingProxyType
 from typing import Optional
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 
-from api.itad_client import ITADClient
-from utils.embeds import create_deals_embed, create_error_embed, create_no_deals_embed
+from api.itad_client import FETCH_CACHE_TTL, ITADClient
+from utils.deal_cache import DealCache
+from utils.embeds import create_deals_embed, create_error_embed, create_no_deals_embed, now_utc
+from utils.validators import validate_discount, validate_method, validate_store
+
+log = logging.getLogger(__name__)
+
+# Method-specific embed info
+_METHOD_DESCRIPTIONS = MappingProxyType({
+    "hybrid": "🔥 Combined popularity sources (most-popular + most-waitlisted + most-collected)",
+    "popular_deals": "📊 Games from ITAD's most-popular endpoint",
+    "waitlisted_deals": "💝 Games from ITAD's most-waitlisted endpoint",
+    "collected_deals": "🎮 Games from ITAD's most-collected endpoint"
+})
+
+_METHOD_ICONS = MappingProxyType({
+    "hybrid": "🔥",
+    "popular_deals": "📊",
+    "waitlisted_deals": "💝",
+    "collected_deals": "🎮"
+})
 
 
 class NativePriority(commands.Cog):
@@ -24,6 +44,21 @@ class NativePriority(commands.Cog):
         # Use the bot's API key if available
         api_key = getattr(bot, 'itad_api_key', None)
         self.itad_client = ITADClient(api_key=api_key) if api_key else None
+        self.deal_cache = DealCache(cache_duration=FETCH_CACHE_TTL)
+        
+        # Fully static error embeds, built once and copied on send
+        self._embed_api_key_missing = create_error_embed(
+            "API Key Missing",
+            "ITAD API key is not configured. Please contact the bot administrator."
+        )
+        self._embed_command_error = create_error_embed(
+            "Command Error",
+            "Failed to fetch native priority deals. Please try again."
+        )
+        self._embed_comparison_error = create_error_embed(
+            "Comparison Error",
+            "Failed to compare priority methods. Please try again."
+        )
 
     async def cog_unload(self):
         """Clean up when cog is unloaded"""
@@ -31,12 +66,26 @@ class NativePriority(commands.Cog):
             await self.itad_client.close()
 
     async def _send_typing(self, ctx: commands.Context):
-        """Send typing indicator"""
+        """Defer slash invocations, send typing indicator for prefix commands"""
+        if ctx.interaction:
+            await ctx.defer()  # Extends the 3s interaction deadline
+            return
         try:
             await ctx.typing()
         except Exception:
             pass
 
+    async def _send_embed(self, ctx: commands.Context, embed: discord.Embed):
+        """Send an embed, respecting the per-channel send rate"""
+        async with self.bot.channel_limiter(ctx.channel.id):
+            await ctx.send(embed=embed)
+
+    async def _send_static_embed(self, ctx: commands.Context, embed: discord.Embed):
+        """Send a copy of a prebuilt embed with a fresh timestamp"""
+        embed = embed.copy()
+        embed.timestamp = now_utc()
+        await self._send_embed(ctx, embed)
+
     @commands.hybrid_command(name="native_priority", aliases=["np", "native", "itad_priority"])
     @app_commands.describe(
         method="Priority calculation method",
@@ -82,63 +131,33 @@ class NativePriority(commands.Cog):
             store: Store to filter by (Steam, Epic, GOG, Xbox)
             min_discount: Minimum discount % (default: 30)
         """
-        # Validate method parameter
-        valid_methods = ['hybrid', 'popular_deals', 'waitlisted_deals', 'collected_deals']
-        if method.lower() not in valid_methods:
-            embed = create_error_embed(
-                "Invalid Method",
-                f"Valid methods: {', '.join(valid_methods)}\\n"
-                f"You provided: `{method}`\\n\\n"
-                "🔥 **hybrid** - Best overall results (recommended)\\n"
-                "📊 **popular_deals** - Most popular games currently\\n" 
-                "💝 **waitlisted_deals** - Most wanted games\\n"
-                "🎮 **collected_deals** - Most owned games"
-            )
-            await ctx.send(embed=embed)
-            return
-        
-        # Validate store parameter
-        if store:
-            store = store.lower().strip()
-            allowed_stores = ['steam', 'epic', 'epic game store', 'gog', 'gog.com', 'microsoft store', 'xbox', 'microsoft']
-            if store not in allowed_stores:
-                embed = create_error_embed(
-                    "Invalid Store",
-                    f"Supported stores: {', '.join(['Steam', 'Epic Game Store', 'GOG', 'Xbox/Microsoft Store'])}\\n"
-                    f"You provided: `{store}`"
-                )
-                await ctx.send(embed=embed)
-                return
+        method_lc = method.lower()
         
-        # Validate discount parameter
-        if min_discount < 0 or min_discount > 99:
-            embed = create_error_embed(
-                "Invalid Discount",
-                f"Discount must be between 0 and 99\\n"
-                f"You provided: `{min_discount}%`"
-            )
-            await ctx.send(embed=embed)
+        # Validate parameters
+        store, error = validate_store(store)
+        error = validate_method(method) or error or validate_discount(min_discount)
+        if error:
+            await self._send_embed(ctx, error)
             return
         
         # Check if ITAD client is available
         if not self.itad_client:
-            embed = create_error_embed(
-                "API Key Missing",
-                "ITAD API key is not configured. Please contact the bot administrator."
-            )
-            await ctx.send(embed=embed)
+            await self._send_static_embed(ctx, self._embed_api_key_missing)
             return
         
-        await self._send_typing(ctx)
-        
         try:
-            # Use native ITAD priority method
-            deals = await self.itad_client.fetch_native_priority_deals(
-                limit=10,
-                min_discount=min_discount,
-                store_filter=store,
-                priority_method=method.lower()
-            )
+            # Use cached results when available, otherwise query ITAD
+            cache_key = (method_lc, store, min_discount)
+            deals = self.deal_cache.get(cache_key)
+            if deals is None:
+                await self._send_typing(ctx)
+                deals = await self.itad_client.fetch_native_priority_deals(
+                    limit=10,
+                    min_discount=min_discount,
+                    store_filter=store,
+                    priority_method=method_lc
+                )
+                self.deal_cache.set(cache_key, deals)
             
             if not deals:
                 embed = create_no_deals_embed(
@@ -150,26 +169,11 @@ class NativePriority(commands.Cog):
                     "• Different method (try `hybrid`)\\n"
                     "• Different store or remove store filter"
                 )
-                await ctx.send(embed=embed)
+                await self._send_embed(ctx, embed)
                 return
             
-            # Create embed with method-specific info
-            method_descriptions = {
-                "hybrid": "🔥 Combined popularity sources (most-popular + most-waitlisted + most-collected)",
-                "popular_deals": "📊 Games from ITAD's most-popular endpoint",
-                "waitlisted_deals": "💝 Games from ITAD's most-waitlisted endpoint", 
-                "collected_deals": "🎮 Games from ITAD's most-collected endpoint"
-            }
-            
-            method_icons = {
-                "hybrid": "🔥",
-                "popular_deals": "📊", 
-                "waitlisted_deals": "💝",
-                "collected_deals": "🎮"
-            }
-            
-            icon = method_icons.get(method.lower(), "🎯")
-            description = method_descriptions.get(method.lower(), f"Using {method} method")
+            icon = _METHOD_ICONS.get(method_lc, "🎯")
+            description = _METHOD_DESCRIPTIONS.get(method_lc, f"Using {method} method")
             
             embed = create_deals_embed(
                 deals=deals,
@@ -180,18 +184,14 @@ class NativePriority(commands.Cog):
                 footer_text="🎯 Using ITAD's native popularity data • No local database required"
             )
             
-            await ctx.send(embed=embed)
+            await self._send_embed(ctx, embed)
             
         except ValueError as e:
             embed = create_error_embed("API Error", str(e))
-            await ctx.send(embed=embed)
+            await self._send_embed(ctx, embed)
         except Exception as e:
-            logging.error(f"Error in native priority command: {e}")
-            embed = create_error_embed(
-                "Command Error",
-                "Failed to fetch native priority deals. Please try again."
-            )
-            await ctx.send(embed=embed)
+            log.error("Error in native priority command: %s", e)
+            await self._send_static_embed(ctx, self._embed_command_error)
 
     @commands.hybrid_command(name="priority_comparison", aliases=["pc", "compare_priority"])
     @app_commands.describe(
@@ -223,25 +223,14 @@ class NativePriority(commands.Cog):
         Example: !priority_comparison steam 50
         """
         # Validate store parameter
-        if store:
-            store = store.lower().strip()
-            allowed_stores = ['steam', 'epic', 'epic game store', 'gog', 'gog.com', 'microsoft store', 'xbox', 'microsoft']
-            if store not in allowed_stores:
-                embed = create_error_embed(
-                    "Invalid Store",
-                    f"Supported stores: {', '.join(['Steam', 'Epic Game Store', 'GOG', 'Xbox/Microsoft Store'])}\\n"
-                    f"You provided: `{store}`"
-                )
-                await ctx.send(embed=embed)
-                return
+        store, error = validate_store(store)
+        if error:
+            await self._send_embed(ctx, error)
+            return
         
         # Check if ITAD client is available
         if not self.itad_client:
-            embed = create_error_embed(
-                "API Key Missing", 
-                "ITAD API key is not configured. Please contact the bot administrator."
-            )
-            await ctx.send(embed=embed)
+            await self._send_static_embed(ctx, self._embed_api_key_missing)
             return
         
         await self._send_typing(ctx)
@@ -267,7 +256,7 @@ class NativePriority(commands.Cog):
                     )
                     all_results[method_id] = (method_name, deals)
                 except Exception as e:
-                    logging.warning(f"Failed to get {method_id} results: {e}")
+                    log.warning("Failed to get %s results: %s", method_id, e)
                     all_results[method_id] = (method_name, [])
             
             # Create comparison embed
@@ -276,16 +265,15 @@ class NativePriority(commands.Cog):
                 description=f"Comparing different native ITAD priority approaches\\n"
                            f"Filters: {min_discount}%+ discount{f', {store.title()} only' if store else ''}",
                 color=0x00FF00,
-                timestamp=discord.utils.utcnow()
+                timestamp=now_utc()
             )
             
             for method_id, (method_name, deals) in all_results.items():
                 if deals:
-                    game_list = []
-                    for i, deal in enumerate(deals[:3], 1):  # Show top 3 per method
-                        game_list.append(f"{i}. **{deal['title']}** - {deal['price']} ({deal.get('discount', 'N/A')})")
-                    
-                    field_value = "\\n".join(game_list)
+                    field_value = "\\n".join(  # Show top 3 per method
+                        f"{i}. **{deal['title']}** - {deal['price']} ({deal.get('discount', 'N/A')})"
+                        for i, deal in enumerate(deals[:3], 1)
+                    )
                     if len(deals) > 3:
                         field_value += f"\\n*...and {len(deals) - 3} more*"
                 else:
@@ -299,15 +287,11 @@ class NativePriority(commands.Cog):
             
             embed.set_footer(text="💡 Use !native_priority hybrid for best overall results")
             
-            await ctx.send(embed=embed)
+            await self._send_embed(ctx, embed)
             
         except Exception as e:
-            logging.error(f"Error in priority comparison: {e}")
-            embed = create_error_embed(
-                "Comparison Error",
-                "Failed to compare priority methods. Please try again."
-            )
-            await ctx.send(embed=embed)
+            log.error("Error in priority comparison: %s", e)
+            await self._send_static_embed(ctx, self._embed_comparison_error)
 
 
 async def setup(bot: commands.Bot):
@@ -12,8 +12,12 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-from api.itad_client import ITADClient
-from utils.embeds import create_deals_embed, create_error_embed, create_no_deals_embed
+from api.itad_client import FETCH_CACHE_TTL, ITADClient
+from utils.deal_cache import DealCache
+from utils.embeds import create_deals_embed, create_error_embed, create_no_deals_embed, now_utc
+from utils.validators import validate_sort, validate_store
+
+log = logging.getLogger(__name__)
 
 
 class QualityDeals(commands.Cog):
@@ -24,6 +28,17 @@ class QualityDeals(commands.Cog):
         # Use the bot's API key if available
         api_key = getattr(bot, 'itad_api_key', None)
         self.itad_client = ITADClient(api_key=api_key) if api_key else None
+        self.deal_cache = DealCache(cache_duration=FETCH_CACHE_TTL)
+        
+        # Fully static error embeds, built once and copied on send
+        self._embed_api_key_missing = create_error_embed(
+            "API Key Missing",
+            "ITAD API key is not configured. Please contact the bot administrator."
+        )
+        self._embed_command_error = create_error_embed(
+            "Command Error",
+            "Failed to fetch quality deals. Please try again."
+        )
 
     async def cog_unload(self):
         """Clean up when cog is unloaded"""
@@ -31,12 +46,26 @@ class QualityDeals(commands.Cog):
             await self.itad_client.close()
 
     async def _send_typing(self, ctx: commands.Context):
-        """Send typing indicator"""
+        """Defer slash invocations, send typing indicator for prefix commands"""
+        if ctx.interaction:
+            await ctx.defer()  # Extends the 3s interaction deadline
+            return
         try:
             await ctx.typing()
         except Exception:
             pass  # Ignore typing errors
 
+    async def _send_embed(self, ctx: commands.Context, embed: discord.Embed):
+        """Send an embed, respecting the per-channel send rate"""
+        async with self.bot.channel_limiter(ctx.channel.id):
+            await ctx.send(embed=embed)
+
+    async def _send_static_embed(self, ctx: commands.Context, embed: discord.Embed):
+        """Send a copy of a prebuilt embed with a fresh timestamp"""
+        embed = embed.copy()
+        embed.timestamp = now_utc()
+        await self._send_embed(ctx, embed)
+
     @commands.hybrid_command(name="quality_deals", aliases=["quality", "q", "interesting"])
     @app_commands.describe(
         store="Store to filter by",
@@ -76,50 +105,32 @@ class QualityDeals(commands.Cog):
             min_discount: Minimum discount % (default: 50)
             sort_by: Sort method - hottest, newest, price, discount (default: hottest)
         """
-        # Validate store parameter
-        if store:
-            store = store.lower().strip()
-            allowed_stores = ['steam', 'epic', 'epic game store', 'gog', 'gog.com', 'microsoft store', 'xbox', 'microsoft']
-            if store not in allowed_stores:
-                embed = create_error_embed(
-                    "Invalid Store",
-                    f"Quality deals only work with: {', '.join(['Steam', 'Epic Game Store', 'GOG', 'Xbox/Microsoft Store'])}\\n"
-                    f"You provided: `{store}`"
-                )
-                await ctx.send(embed=embed)
-                return
-        
-        # Validate sort parameter
-        valid_sorts = ['hottest', 'popular', 'newest', 'price', 'discount', 'cut']
-        if sort_by.lower() not in valid_sorts:
-            embed = create_error_embed(
-                "Invalid Sort Method", 
-                f"Valid options: {', '.join(valid_sorts)}\\n"
-                f"You provided: `{sort_by}`"
-            )
-            await ctx.send(embed=embed)
+        # Validate parameters
+        store, error = validate_store(store, prefix="Quality deals only work with")
+        error = error or validate_sort(sort_by)
+        if error:
+            await self._send_embed(ctx, error)
             return
         
         # Check if ITAD client is available
         if not self.itad_client:
-            embed = create_error_embed(
-                "API Key Missing",
-                "ITAD API key is not configured. Please contact the bot administrator."
-            )
-            await ctx.send(embed=embed)
+            await self._send_static_embed(ctx, self._embed_api_key_missing)
             return
             
-        await self._send_typing(ctx)
-        
         try:
-            # Use ITAD quality method
-            deals = await self.itad_client.fetch_quality_deals_itad_method(
-                limit=10,
-                min_discount=min_discount,
-                sort_by=sort_by.lower(),
-                store_filter=store,
-                use_popularity_stats=True
-            )
+            # Use cached results when available, otherwise query ITAD
+            cache_key = (sort_by.lower(), store, min_discount)
+            deals = self.deal_cache.get(cache_key)
+            if deals is None:
+                await self._send_typing(ctx)
+                deals = await self.itad_client.fetch_quality_deals_itad_method(
+                    limit=10,
+                    min_discount=min_discount,
+                    sort_by=sort_by.lower(),
+                    store_filter=store,
+                    use_popularity_stats=True
+                )
+                self.deal_cache.set(cache_key, deals)
             
             if not deals:
                 embed = create_no_deals_embed(
@@ -128,7 +139,7 @@ class QualityDeals(commands.Cog):
                     f"{f' on {store.title()}' if store else ''}\\n"
                     "Try lowering the discount percentage or different store."
                 )
-                await ctx.send(embed=embed)
+                await self._send_embed(ctx, embed)
                 return
             
             # Create embed with quality deals
@@ -140,18 +151,14 @@ class QualityDeals(commands.Cog):
                 footer_text="✨ Curated using ITAD's popularity data and quality filtering"
             )
             
-            await ctx.send(embed=embed)
+            await self._send_embed(ctx, embed)
             
         except ValueError as e:
             embed = create_error_embed("API Error", str(e))
-            await ctx.send(embed=embed)
+            await self._send_embed(ctx, embed)
         except Exception as e:
-            logging.error(f"Error in quality deals command: {e}")
-            embed = create_error_embed(
-                "Command Error", 
-                "Failed to fetch quality deals. Please try again."
-            )
-            await ctx.send(embed=embed)
+            log.error("Error in quality deals command: %s", e)
+            await self._send_static_embed(ctx, self._embed_command_error)
 
 
 async def setup(bot: commands.Bot):
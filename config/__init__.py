@@ -2,6 +2,6 @@
 """Configuration modules for GameDealer bot"""
 
 from .app_config import AppConfig, load_config
-from .logging_config import setup_logging, get_logger, get_log_directory
+from .logging_config import setup_logging, stop_logging, get_logger, get_log_directory, SamplingFilter
 
-__all__ = ['AppConfig', 'load_config', 'setup_logging', 'get_logger', 'get_log_directory']
+__all__ = ['AppConfig', 'load_config', 'setup_logging', 'stop_logging', 'get_logger', 'get_log_directory', 'SamplingFilter']
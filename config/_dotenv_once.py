@@ -0,0 +1,17 @@
+# config/_dotenv_once.py
+"""Load the .env file at most once per process"""
+import threading
+from dotenv import load_dotenv
+
+_loaded = False
+_lock = threading.Lock()
+
+def ensure_loaded() -> None:
+    """Parse .env on first call; later calls are a flag check"""
+    global _loaded
+    if _loaded:
+        return
+    with _lock:
+        if not _loaded:
+            load_dotenv()
+            _loaded = True
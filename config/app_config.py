@@ -1,11 +1,33 @@
 # config/app_config.py
+import logging
 import os
-from typing import NamedTuple, Optional
-from dotenv import load_dotenv
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+from ._dotenv_once import ensure_loaded
+
+# Accepted LOG_LEVEL names, resolved to logging ints without module getattr
+_LOG_LEVELS = MappingProxyType({
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+})
+
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+def env_bool(name: str, default: bool = False, env: Optional[Mapping[str, str]] = None) -> bool:
+    """Read a boolean flag from the environment (1/true/yes/on count as true)"""
+    value = (os.environ if env is None else env).get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
 
 class ConfigError(Exception):
     """Raised when configuration is invalid"""
-    pass
+    __slots__ = ()
 
 class AppConfig(NamedTuple):
     """Application configuration settings with validation"""
@@ -14,6 +36,7 @@ class AppConfig(NamedTuple):
     deals_channel_id: int
     itad_api_key: str
     debug_api_responses: bool = False
+    log_level: int = logging.INFO
     
     def validate(self) -> None:
         """Validate configuration values"""
@@ -32,30 +55,51 @@ class AppConfig(NamedTuple):
         except ConfigError:
             return False
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
-    """Load configuration from environment variables with validation"""
-    load_dotenv()
+    """
+    Load configuration from environment variables with validation
+    
+    The result is cached for the life of the process; call
+    load_config.cache_clear() to re-read the environment.
+    """
+    ensure_loaded()
     
-    discord_token: str = os.getenv("DISCORD_TOKEN", "")
+    # Read every setting from one snapshot of the environment
+    env = dict(os.environ)
+    
+    discord_token: str = env.get("DISCORD_TOKEN", "")
     
     # Parse channel IDs with error handling
     try:
-        log_channel_id: int = int(os.getenv("LOG_CHANNEL_ID", "0"))
+        log_channel_id: int = int(env.get("LOG_CHANNEL_ID", "0"))
     except ValueError:
         raise ConfigError("LOG_CHANNEL_ID must be a valid integer")
         
     try:
-        deals_channel_id: int = int(os.getenv("DEALS_CHANNEL_ID", str(log_channel_id)))
+        deals_channel_id: int = int(env.get("DEALS_CHANNEL_ID", str(log_channel_id)))
     except ValueError:
         raise ConfigError("DEALS_CHANNEL_ID must be a valid integer")
     
-    itad_api_key: str = os.getenv("ITAD_API_KEY", "")
-    debug_api_responses: bool = os.getenv("DEBUG_API_RESPONSES", "false").lower() == "true"
+    itad_api_key: str = env.get("ITAD_API_KEY", "")
+    debug_api_responses: bool = env_bool("DEBUG_API_RESPONSES", env=env)
+    
+    # Resolve the level name once so logging setup gets a ready int
+    log_level: int = _LOG_LEVELS.get(env.get("LOG_LEVEL", "INFO").strip().upper(), logging.INFO)
     
     return AppConfig(
         discord_token=discord_token,
         log_channel_id=log_channel_id,
         deals_channel_id=deals_channel_id,
         itad_api_key=itad_api_key,
-        debug_api_responses=debug_api_responses
-    )
\ No newline at end of file
+        debug_api_responses=debug_api_responses,
+        log_level=log_level
+    )
+
+def __getattr__(name: str):
+    """Resolve CONFIG on first access so importing this module has no side effects"""
+    if name == "CONFIG":
+        config = load_config()
+        globals()["CONFIG"] = config  # Later reads are plain module attribute lookups
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
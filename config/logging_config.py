@@ -1,15 +1,67 @@
 # config/logging_config.py
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from typing import Optional
 
 # Write logs into ./logs/discord.log 
 ROOT_DIR = os.path.dirname(os.path.dirname(__file__))  
 LOG_DIR = os.path.join(ROOT_DIR, "logs")
+LOG_FILE_PATH = os.path.join(LOG_DIR, "discord.log")
+
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LOG_DIR_READY = False
+_CONFIGURED = False
+
+LOG_BUFFER_SIZE = 8 * 1024  # bytes held before the file is written
+LOG_FLUSH_INTERVAL = 1.0  # seconds between periodic flushes
+
+# Background writer that owns the real handlers; the event loop only enqueues
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Chatty third-party loggers only need to surface problems
+QUIET_LOGGERS = ('discord', 'aiohttp')
+
+class SamplingFilter(logging.Filter):
+    """Let through one record out of every rate records"""
+
+    def __init__(self, rate: int) -> None:
+        super().__init__()
+        self.rate = rate
+        self.n = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        self.n += 1
+        return (self.n % self.rate) == 0
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that buffers writes instead of flushing after every record"""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                     encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()  # Don't sit on errors in case the process dies
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 def get_log_directory() -> str:
-    """Get the log directory path, creating it if necessary"""
-    os.makedirs(LOG_DIR, exist_ok=True)
+    """Get the log directory path, creating it on first use"""
+    global _LOG_DIR_READY
+    if not _LOG_DIR_READY:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        _LOG_DIR_READY = True
     return LOG_DIR
 
 def setup_logging(level: int = logging.INFO, force_reconfigure: bool = True) -> logging.Logger:
@@ -23,28 +75,78 @@ def setup_logging(level: int = logging.INFO, force_reconfigure: bool = True) ->
     Returns:
         Configured logger instance
     """
+    global _CONFIGURED, _listener
+    
+    # Already set up and no reconfiguration requested
+    if _CONFIGURED and not force_reconfigure:
+        return logging.getLogger('GameDealer')
+    
     # Clear any existing handlers to prevent conflicts if force_reconfigure is True
     if force_reconfigure:
+        stop_logging()
         for handler in logging.root.handlers[:]:
             logging.root.removeHandler(handler)
     
+    # Our format never shows thread/process info, so skip collecting it per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Ensure log directory exists
-    log_dir = get_log_directory()
+    get_log_directory()
+    
+    # File and console output share one formatter and run on the listener thread
+    handlers = [
+        BufferedFileHandler(LOG_FILE_PATH, encoding='utf-8'),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(_FORMATTER)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    # Root only enqueues records, so logging never blocks on disk or console I/O
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
     
-    # Configure logging with proper handlers
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(os.path.join(log_dir, 'discord.log'), encoding='utf-8'),
-            logging.StreamHandler()
-        ],
+        handlers=[queue_handler],
         force=force_reconfigure
     )
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+    _CONFIGURED = True
     
     # Return a logger for the calling module
     return logging.getLogger('GameDealer')
 
+def flush_logs() -> None:
+    """Write out any buffered log output"""
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.flush()
+
+async def flush_logs_periodically(interval: float = LOG_FLUSH_INTERVAL) -> None:
+    """Flush buffered log output every interval seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        flush_logs()
+
+def stop_logging() -> None:
+    """Drain queued log records and close the handlers behind the listener"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+atexit.register(stop_logging)
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get a logger instance. Call setup_logging() first.
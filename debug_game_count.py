@@ -3,14 +3,10 @@ Debug why native priority is only returning 3 games
 """
 
 import asyncio
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
 import sys
 sys.path.insert(0, '.')
 
+from config.app_config import CONFIG
 from api.itad_client import ITADClient
 
 
@@ -19,7 +15,7 @@ async def debug_game_count():
     print("🔍 Debugging Game Count Issue")
     print("=" * 50)
     
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     if not api_key:
         print("❌ ITAD_API_KEY not found")
         return
@@ -57,14 +53,21 @@ async def debug_game_count():
             ("collected_deals", "🎮 Collected")
         ]
         
-        for method_id, method_name in methods:
-            deals = await client.fetch_native_priority_deals(
+        method_results = await asyncio.gather(*(
+            client.fetch_native_priority_deals(
                 limit=10,
                 min_discount=20,
                 store_filter=None,
                 priority_method=method_id
             )
-            print(f"   {method_name}: {len(deals)} deals")
+            for method_id, _ in methods
+        ), return_exceptions=True)
+        
+        for (method_id, method_name), deals in zip(methods, method_results):
+            if isinstance(deals, Exception):
+                print(f"   {method_name}: Error - {deals}")
+            else:
+                print(f"   {method_name}: {len(deals)} deals")
         
         # Let's check what the raw deals API returns
         print(f"\n🌐 Testing raw deals API (Steam + Epic + GOG):")
@@ -74,27 +77,24 @@ async def debug_game_count():
         epic_id = client._get_shop_id("epic") 
         gog_id = client._get_shop_id("gog")
         
-        for store_name, shop_id in [("Steam", steam_id), ("Epic", epic_id), ("GOG", gog_id)]:
-            if shop_id:
-                try:
-                    url = "https://api.isthereanydeal.com/deals/v2"
-                    params = {
-                        "key": api_key,
-                        "limit": 20,
-                        "shops": str(shop_id),
-                        "offset": 0
-                    }
-                    
-                    response = await client.http.get_json(url, params=params)
-                    
-                    if response and 'list' in response:
-                        deals_count = len(response['list'])
-                        print(f"   {store_name} (ID {shop_id}): {deals_count} raw deals available")
-                    else:
-                        print(f"   {store_name} (ID {shop_id}): No deals found")
-                        
-                except Exception as e:
-                    print(f"   {store_name} (ID {shop_id}): Error - {e}")
+        url = "https://api.isthereanydeal.com/deals/v2"
+        base_params = {"key": api_key, "limit": 20, "offset": 0}
+        stores = [(name, shop_id) for name, shop_id in [("Steam", steam_id), ("Epic", epic_id), ("GOG", gog_id)] if shop_id]
+        
+        # Stores are independent, so fetch them concurrently
+        responses = await asyncio.gather(*(
+            client.http.get_json(url, params={**base_params, "shops": str(shop_id)})
+            for _, shop_id in stores
+        ), return_exceptions=True)
+        
+        for (store_name, shop_id), response in zip(stores, responses):
+            if isinstance(response, Exception):
+                print(f"   {store_name} (ID {shop_id}): Error - {response}")
+            elif response and 'list' in response:
+                deals_count = len(response['list'])
+                print(f"   {store_name} (ID {shop_id}): {deals_count} raw deals available")
+            else:
+                print(f"   {store_name} (ID {shop_id}): No deals found")
         
         # Test combined shop IDs
         print(f"\n🔗 Testing combined shop IDs:")
@@ -135,21 +135,20 @@ async def debug_game_count():
             ("most-collected", "Most Collected")
         ]
         
-        for endpoint, name in popularity_endpoints:
-            try:
-                url = f"https://api.isthereanydeal.com/stats/{endpoint}/v1"
-                params = {"limit": 500}  # Max we request
-                
-                response = await client.http.get_json(url, params=params)
-                
-                if response and 'list' in response:
-                    games_count = len(response['list'])
-                    print(f"   {name}: {games_count} games available")
-                else:
-                    print(f"   {name}: No data")
-                    
-            except Exception as e:
-                print(f"   {name}: Error - {e}")
+        params = {"limit": 500}  # Max we request
+        responses = await asyncio.gather(*(
+            client.http.get_json(f"https://api.isthereanydeal.com/stats/{endpoint}/v1", params=params)
+            for endpoint, _ in popularity_endpoints
+        ), return_exceptions=True)
+        
+        for (endpoint, name), response in zip(popularity_endpoints, responses):
+            if isinstance(response, Exception):
+                print(f"   {name}: Error - {response}")
+            elif response and 'list' in response:
+                games_count = len(response['list'])
+                print(f"   {name}: {games_count} games available")
+            else:
+                print(f"   {name}: No data")
         
     finally:
         await client.close()
@@ -3,17 +3,15 @@ import os
 import asyncio
 import logging
 import sys
-from typing import NoReturn, Optional
-from dotenv import load_dotenv
+from typing import NoReturn, Optional, TYPE_CHECKING
 from config.app_config import load_config, ConfigError
-from config.logging_config import setup_logging
-from bot.core import create_bot
+from config.logging_config import setup_logging, stop_logging, flush_logs_periodically
+
+if TYPE_CHECKING:
+    from bot.core import GameDealerBot
 
 async def main() -> None:
     """Main entry point for scheduled deal fetching with enhanced error handling"""
-    # Load environment variables
-    load_dotenv()
-    
     # Setup logging first
     log: logging.Logger = setup_logging(level=logging.INFO)
     
@@ -28,21 +26,20 @@ async def main() -> None:
         log.error(f"Failed to load configuration: {e}")
         sys.exit(1)
     
+    # Apply the configured level (parsed once in load_config)
+    logging.getLogger().setLevel(config.log_level)
+    
     log.info("Starting GameDealer bot (scheduled mode with timer system)...")
     
     # Warn about missing ITAD API key but don't exit
     if not config.itad_api_key:
         log.warning("ITAD_API_KEY is missing. Deal fetching will not work.")
     
-    # Initialize bot
-    bot = create_bot(
-        log=log,
-        log_channel_id=config.log_channel_id,
-        deals_channel_id=config.deals_channel_id,
-        itad_api_key=config.itad_api_key
-    )
+    # Deferred so config errors exit without loading discord.py
+    from bot.core import create_bot
     
-    bot: Optional[object] = None
+    bot: Optional[GameDealerBot] = None
+    flush_task = asyncio.create_task(flush_logs_periodically())
     try:
         # Create and run bot
         bot = create_bot(
@@ -60,9 +57,11 @@ async def main() -> None:
         sys.exit(1)
     finally:
         # Ensure proper cleanup
-        if not bot.is_closed():
+        if bot is not None and not bot.is_closed():
             await bot.close()
         log.info("Bot shutdown complete")
+        flush_task.cancel()
+        stop_logging()
 
 def run_bot() -> NoReturn:
     """Run the bot with proper exception handling"""
@@ -1,5 +1,7 @@
 from .models import (
     Deal,
+    parse_discount,
+    deal_discount,
     PriorityGame,
     FilterResult,
     DatabaseStats,
@@ -8,17 +10,21 @@ from .models import (
     ITADDealData,
     ITADGameItem,
     StoreFilter,
+    VALID_STORES,
+    STORE_ALIASES,
+    canonical_store,
     InteractionLike,
     ContextLike,
     InteractionOrContext,
     APIError,
-    BotConfig,
     EnhancedDeal,
     APIResponse
 )
 
 __all__ = [
     'Deal',
+    'parse_discount',
+    'deal_discount',
     'PriorityGame', 
     'FilterResult',
     'DatabaseStats',
@@ -27,11 +33,13 @@ __all__ = [
     'ITADDealData',
     'ITADGameItem',
     'StoreFilter',
+    'VALID_STORES',
+    'STORE_ALIASES',
+    'canonical_store',
     'InteractionLike',
     'ContextLike',
     'InteractionOrContext',
     'APIError',
-    'BotConfig',
     'EnhancedDeal',
     'APIResponse'
 ]
\ No newline at end of file
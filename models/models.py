@@ -1,16 +1,46 @@
 # models/models.py
-from typing import TypedDict, Optional, Literal, Union, Protocol, Any, Dict, List, runtime_checkable
+from typing import TypedDict, Optional, Literal, Union, Protocol, Any, Dict, FrozenSet, List, get_args, runtime_checkable
+from types import MappingProxyType
 from datetime import datetime
+import re
 
 # Store filtering types
 StoreFilter = Literal[
     "Steam", "Epic Game Store", "Epic", "GOG", "GOG.com", "Fanatical", 
     "Humble Store", "Humble", "Green Man Gaming", "GMG", "Origin", 
-    "Uplay", "Ubisoft Connect", "Microsoft Store", "Xbox", 
-    "PlayStation Store", "PSN", "Nintendo eShop", "Nintendo", 
+    "Uplay", "Ubisoft Connect", "Microsoft Store", "Microsoft", "Xbox", 
+    "PlayStation Store", "PlayStation", "PSN", "Nintendo eShop", "Nintendo", 
     "Battle.net", "Blizzard", "itch.io", "itch"
 ]
 
+# Every accepted store spelling, taken from the StoreFilter literal
+VALID_STORES: FrozenSet[str] = frozenset(get_args(StoreFilter))
+
+# Short or legacy spellings mapped to their canonical store name
+STORE_ALIASES = MappingProxyType({
+    "Epic": "Epic Game Store",
+    "GOG.com": "GOG",
+    "Humble": "Humble Store",
+    "GMG": "Green Man Gaming",
+    "Uplay": "Ubisoft Connect",
+    "Microsoft": "Microsoft Store",
+    "Xbox": "Microsoft Store",
+    "PlayStation": "PlayStation Store",
+    "PSN": "PlayStation Store",
+    "Nintendo": "Nintendo eShop",
+    "Blizzard": "Battle.net",
+    "itch": "itch.io",
+})
+
+# Case-insensitive lookup built once: lowercase spelling -> canonical name
+_CANONICAL_STORES = MappingProxyType({
+    name.lower(): STORE_ALIASES.get(name, name) for name in VALID_STORES
+})
+
+def canonical_store(name: str) -> Optional[str]:
+    """Return the canonical store name for any accepted spelling, or None"""
+    return _CANONICAL_STORES.get(name.strip().lower())
+
 # Priority game data structure
 class PriorityGame(TypedDict):
     title: str
@@ -66,8 +96,27 @@ class Deal(TypedDict, total=False):
     store: str
     url: str
     discount: Optional[str]
+    discount_pct: int  # numeric discount, parsed once when the deal is built
     original_price: Optional[str]
 
+_DISCOUNT_RE = re.compile(r'(\d+)')
+
+def parse_discount(discount: Union[str, int, None]) -> int:
+    """Return the numeric value of a discount string like '75%', or 0"""
+    if isinstance(discount, int):
+        return discount
+    if not isinstance(discount, str):
+        return 0
+    match = _DISCOUNT_RE.search(discount)
+    return int(match.group(1)) if match else 0
+
+def deal_discount(deal: Deal) -> int:
+    """Numeric discount of a deal, parsing the string only for deals built without discount_pct"""
+    discount_pct = deal.get('discount_pct')
+    if isinstance(discount_pct, int):
+        return discount_pct
+    return parse_discount(deal.get('discount'))
+
 # Enhanced deal with metadata (for future use)
 class EnhancedDeal(Deal, total=False):
     fetched_at: datetime
@@ -84,14 +133,6 @@ class APIResponse(TypedDict, total=False):
     endpoint: str
     timestamp: datetime
 
-# Configuration types
-class BotConfig(TypedDict):
-    discord_token: str
-    log_channel_id: int
-    deals_channel_id: int
-    itad_api_key: str
-    debug_api_responses: bool
-
 # Protocol interfaces for better type safety
 @runtime_checkable
 class InteractionLike(Protocol):
@@ -0,0 +1,38 @@
+# tests/_offline.py
+"""
+Local stand-in for the ITAD API
+
+Serves a canned payload from a local aiohttp server so tests can exercise
+the client's parsing and filtering without touching the network.
+"""
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import orjson
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+DEALS_FIXTURE = FIXTURES_DIR / "deals_sample.json"
+
+
+def load_fixture(path: Path = DEALS_FIXTURE) -> Any:
+    """Parse a canned ITAD response from tests/fixtures"""
+    return orjson.loads(path.read_bytes())
+
+
+@asynccontextmanager
+async def offline_itad(payload: Any) -> AsyncIterator[str]:
+    """Answer every GET with payload and yield the server's base URL"""
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response(payload)
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("")).rstrip("/")
+    finally:
+        await server.close()
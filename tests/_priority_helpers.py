@@ -0,0 +1,157 @@
+# tests/_priority_helpers.py
+"""
+Manual priority matching shared by the priority search scripts
+
+Matches fetched deals against the priority games database by title: an exact
+title beats a contained one, and a higher priority beats both.
+"""
+import codecs
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Keep the scripts runnable without orjson installed
+    from json import loads as json_loads
+
+from models import deal_discount
+
+PRIORITY_DB = Path(__file__).resolve().parent.parent / "data" / "priority_games.json"
+
+# Match scores in percent, packed below the priority level in a single sort key
+_EXACT_SCORE = 100
+_CONTAINS_SCORE = 80
+_SCORE_BITS = 7
+_SCORE_MASK = (1 << _SCORE_BITS) - 1
+
+# Word runs used to index titles; splitting on whitespace alone would keep
+# punctuation attached ("bloodborne:", "nioh™") and miss shared words
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@dataclass(slots=True)
+class MatchedDeal:
+    """A fetched deal paired with the priority game it matched"""
+    title: str          # Canonical title from the priority database
+    priority: int
+    category: str
+    notes: str
+    match_score: float  # 1.0 for an exact title, 0.8 for a contained one
+    discount_pct: int
+    discount: str
+    price: str
+    store: str
+    deal: Mapping[str, Any]
+
+
+@lru_cache(maxsize=1)
+def load_priority_games(path: Path = PRIORITY_DB) -> Tuple[Dict[str, Any], ...]:
+    """Parse the priority games database once per process"""
+    # The file is saved with a UTF-8 BOM, which the JSON parsers reject
+    raw = path.read_bytes().removeprefix(codecs.BOM_UTF8)
+    return tuple(json_loads(raw).get("games", []))
+
+
+def prepared_deals(deals: Iterable[Mapping[str, Any]], min_discount: int) -> Iterator[Tuple[str, int, Mapping[str, Any]]]:
+    """Yield (normalized_title, discount_pct, deal) for the first qualifying deal per title"""
+    seen = set()
+    for deal in deals:
+        # Cheapest check first: deals arrive with their discount already parsed
+        discount_pct = deal_discount(deal)
+        if discount_pct < min_discount:
+            continue
+        deal_title = deal.get("title", "").strip()
+        if not deal_title:
+            continue
+        normalized_title = deal_title.lower()
+        if normalized_title in seen:
+            continue
+        seen.add(normalized_title)
+        yield normalized_title, discount_pct, deal
+
+
+def match_deals_to_priority(
+    deals: Iterable[Mapping[str, Any]],
+    priority_games: Iterable[Dict[str, Any]],
+    min_priority: int,
+    min_discount: int
+) -> List[MatchedDeal]:
+    """Match deals to their best priority game, one deal per priority game"""
+    # Index eligible games by title token, highest priority first (stable, so
+    # database order is kept within a level); each deal then only scores the
+    # games that share at least one word with it
+    eligible_games = []
+    priority_by_token = defaultdict(list)
+    for priority_game in sorted(priority_games, key=lambda g: -g.get("priority", 0)):
+        if priority_game.get("priority", 0) < min_priority:
+            continue
+        priority_title = priority_game.get("title", "").lower().strip()
+        index = len(eligible_games)
+        eligible_games.append((priority_game, priority_title))
+        for token in set(_TOKEN_RE.findall(priority_title)):
+            priority_by_token[token].append(index)
+
+    matched_deals = []
+    seen_titles = set()  # Canonical titles of matched priority games
+
+    for normalized_title, discount_pct, deal in prepared_deals(deals, min_discount):
+        # Skip titles already taken by a matched priority game
+        if normalized_title in seen_titles:
+            continue
+
+        candidates = set()
+        for token in _TOKEN_RE.findall(normalized_title):
+            candidates.update(priority_by_token.get(token, ()))
+
+        # Candidates are ranked by a packed (priority_level, score) integer so
+        # one comparison picks the winner; the first one wins ties
+        best_game = None
+        best_key = -1
+        for index in sorted(candidates):
+            priority_game, priority_title = eligible_games[index]
+            priority_level = priority_game.get("priority", 0)
+
+            # Remaining candidates can't beat a match at a higher level,
+            # nor an exact match at this one
+            if best_key >= (priority_level << _SCORE_BITS) | _EXACT_SCORE:
+                break
+
+            if priority_title == normalized_title:
+                match_score = _EXACT_SCORE
+            elif priority_title in normalized_title or normalized_title in priority_title:
+                match_score = _CONTAINS_SCORE
+            else:
+                continue
+
+            key = (priority_level << _SCORE_BITS) | match_score
+            if key > best_key:
+                best_game = priority_game
+                best_key = key
+
+        if best_game is None:
+            continue
+
+        # Use the priority game's canonical title for deduplication (more reliable)
+        canonical_title = best_game.get("title", "").lower().strip()
+        if canonical_title in seen_titles:
+            continue
+        seen_titles.add(canonical_title)
+
+        matched_deals.append(MatchedDeal(
+            title=best_game.get("title", ""),
+            priority=best_game.get("priority", 0),
+            category=best_game.get("category", ""),
+            notes=best_game.get("notes", ""),
+            match_score=(best_key & _SCORE_MASK) / 100,
+            discount_pct=discount_pct,
+            discount=deal.get("discount", "N/A"),
+            price=deal.get("price", "N/A"),
+            store=deal.get("store", "Unknown"),
+            deal=deal,
+        ))
+
+    return matched_deals
@@ -0,0 +1,80 @@
+# tests/_runner.py
+"""
+Runners for the test scripts
+
+Runs independent test coroutines together under a concurrency cap. Each
+test's printed output is captured separately and written out in order once
+all of them finish, so the report reads the same as a sequential run.
+buffered_stdout() gives a single script the same one-write output, and
+run_script() starts a script's entry point on uvloop when it is installed.
+"""
+import asyncio
+import contextlib
+import contextvars
+import io
+import sys
+from typing import Any, Awaitable, Callable, Coroutine, Iterator, List, Optional
+
+DEFAULT_CONCURRENCY = 4  # stay under the per-host connection cap
+
+_output: contextvars.ContextVar[Optional[io.StringIO]] = contextvars.ContextVar('_output', default=None)
+
+
+class _TaskRoutedStdout(io.TextIOBase):
+    """Send writes to the current task's buffer, or to the real stream outside one"""
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buf = _output.get()
+        return (buf if buf is not None else self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+async def run_concurrently(
+    *tests: Callable[[], Awaitable[Any]],
+    limit: int = DEFAULT_CONCURRENCY
+) -> List[Any]:
+    """Run test coroutine functions in a TaskGroup and return their results in order"""
+    sem = asyncio.Semaphore(limit)
+    buffers = [io.StringIO() for _ in tests]
+
+    async def run(test: Callable[[], Awaitable[Any]], buf: io.StringIO) -> Any:
+        _output.set(buf)  # each task runs in its own copy of the context
+        async with sem:
+            return await test()
+
+    real_stdout = sys.stdout
+    sys.stdout = _TaskRoutedStdout(real_stdout)
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run(test, buf)) for test, buf in zip(tests, buffers)]
+    finally:
+        sys.stdout = real_stdout
+        for buf in buffers:
+            real_stdout.write(buf.getvalue())
+    return [task.result() for task in tasks]
+
+
+@contextlib.contextmanager
+def buffered_stdout() -> Iterator[io.StringIO]:
+    """Collect everything printed in the block and write it out in one call"""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield buf
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+def run_script(main: Coroutine[Any, Any, Any]) -> Any:
+    """asyncio.run() on uvloop's faster event loop when it is available"""
+    try:
+        import uvloop
+    except ImportError:  # optional; not built for Windows
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -0,0 +1,47 @@
+# tests/_session.py
+"""
+Shared aiohttp session for the test and debug scripts
+
+Lets one script reuse a single pooled connection to api.isthereanydeal.com
+instead of paying DNS + TCP + TLS setup for every client it creates.
+"""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+from api.http import DEFAULT_TIMEOUT
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide pooled ClientSession, creating it on first use"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        _session = aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session if one was opened"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+@asynccontextmanager
+async def shared_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the shared ClientSession and close it when the block exits"""
+    try:
+        yield await get_session()
+    finally:
+        await close_session()
@@ -0,0 +1,38 @@
+# tests/conftest.py
+"""
+Shared pytest fixtures for the test scripts
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project packages importable before any fixture needs them
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config._dotenv_once import ensure_loaded
+from utils.game_filters import PriorityGameFilter
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line("markers", "offline: runs against canned ITAD responses, no network")
+    config.addinivalue_line("markers", "integration: talks to the real ITAD API")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env() -> None:
+    """Parse .env once for the whole test session"""
+    ensure_loaded()
+
+
+@pytest.fixture(scope="session")
+def priority_filter() -> PriorityGameFilter:
+    """One PriorityGameFilter (and one database parse) for the whole session"""
+    return PriorityGameFilter()
+
+
+@pytest.fixture
+def itad_payload():
+    """Canned ITAD /deals/v2 response from tests/fixtures"""
+    from _offline import load_fixture
+    return load_fixture()
@@ -11,51 +11,41 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from api.itad_client import ITADClient
-from config.app_config import load_config
+from config.app_config import CONFIG
+from _session import get_session, close_session
+from _runner import run_script
 
 async def debug_intersection_logic():
     """Debug the intersection matching between popular games and current deals"""
     
     # Initialize client
-    config = load_config()
-    client = ITADClient(config.itad_api_key)
+    client = ITADClient(CONFIG.itad_api_key, session=await get_session())
     
     print("=== DEBUGGING INTERSECTION LOGIC ===\n")
     
     # Test the popular intersection method directly
     try:
-        print("1. Testing Popular Intersection Logic:")
-        popular_deals = await client._fetch_popular_intersection_deals(
-            limit=15, 
-            min_discount=0, 
-            shop_ids=[61, 16, 35],  # Steam, Epic, GOG
-            popularity_type="popular"
-        )
-        print(f"   Results: {len(popular_deals)} deals found")
-        for deal in popular_deals[:5]:
-            print(f"   - {deal['title']} ({deal.get('discount', 'N/A')} off on {deal['store']})")
+        # The three popularity types are independent, so query them concurrently
+        sections = [
+            ("1. Testing Popular Intersection Logic:", "popular"),
+            ("\n2. Testing Collected Intersection Logic:", "collected"),
+            ("\n3. Testing Waitlisted Intersection Logic:", "waitlisted"),
+        ]
+        results = await asyncio.gather(*(
+            client._fetch_popular_intersection_deals(
+                limit=15, 
+                min_discount=0, 
+                shop_ids=[61, 16, 35],  # Steam, Epic, GOG
+                popularity_type=popularity_type
+            )
+            for _, popularity_type in sections
+        ))
         
-        print("\n2. Testing Collected Intersection Logic:")
-        collected_deals = await client._fetch_popular_intersection_deals(
-            limit=15, 
-            min_discount=0, 
-            shop_ids=[61, 16, 35],  # Steam, Epic, GOG
-            popularity_type="collected"
-        )
-        print(f"   Results: {len(collected_deals)} deals found")
-        for deal in collected_deals[:5]:
-            print(f"   - {deal['title']} ({deal.get('discount', 'N/A')} off on {deal['store']})")
-            
-        print("\n3. Testing Waitlisted Intersection Logic:")
-        waitlisted_deals = await client._fetch_popular_intersection_deals(
-            limit=15, 
-            min_discount=0, 
-            shop_ids=[61, 16, 35],  # Steam, Epic, GOG
-            popularity_type="waitlisted"
-        )
-        print(f"   Results: {len(waitlisted_deals)} deals found")
-        for deal in waitlisted_deals[:5]:
-            print(f"   - {deal['title']} ({deal.get('discount', 'N/A')} off on {deal['store']})")
+        for (heading, _), deals in zip(sections, results):
+            print(heading)
+            print(f"   Results: {len(deals)} deals found")
+            for deal in deals[:5]:
+                print(f"   - {deal['title']} ({deal.get('discount', 'N/A')} off on {deal['store']})")
             
     except Exception as e:
         print(f"Error in intersection logic: {e}")
@@ -68,8 +58,7 @@ async def debug_intersection_details():
     """Debug the detailed intersection process to see where the bottleneck is"""
     
     # Initialize client
-    config = load_config()
-    client = ITADClient(config.itad_api_key)
+    client = ITADClient(CONFIG.itad_api_key, session=await get_session())
     
     print("\n=== DETAILED INTERSECTION DEBUGGING ===\n")
     
@@ -118,16 +107,17 @@ async def debug_intersection_details():
         current_deals = deals_data.get("list", [])
         print(f"   Current deals fetched: {len(current_deals)}")
         
+        # Resolve and lowercase each deal title once; steps 3 and 4 share them
+        deal_titles = [client._get_title_v2(deal) for deal in current_deals[:50]]
+        deal_titles_lower = [title.lower() for title in deal_titles]
+        
         # Step 3: Test matching process
         print("\nStep 3: Testing title matching...")
         matches_found = 0
         sample_matches = []
         sample_non_matches = []
         
-        for deal_item in current_deals[:50]:  # Test first 50 deals
-            title = client._get_title_v2(deal_item)
-            title_lower = title.lower()
-            
+        for title, title_lower in zip(deal_titles, deal_titles_lower):  # Test first 50 deals
             if title_lower in popular_games_data:
                 matches_found += 1
                 if len(sample_matches) < 5:
@@ -142,21 +132,21 @@ async def debug_intersection_details():
         
         # Step 4: Try fuzzy matching for non-matches
         print("\nStep 4: Analyzing match failures...")
-        deal_titles = [client._get_title_v2(deal).lower() for deal in current_deals[:20]]
         popular_titles = list(popular_games_data.keys())[:20]
         
-        print(f"   Sample deal titles: {deal_titles[:5]}")
+        print(f"   Sample deal titles: {deal_titles_lower[:5]}")
         print(f"   Sample popular titles: {popular_titles[:5]}")
         
-        # Look for partial matches
+        # Look for partial matches, skipping too-short titles up front
+        candidate_deals = [t for t in deal_titles_lower[:10] if len(t) > 3]
+        candidate_popular = [t for t in popular_titles if len(t) > 3]
         partial_matches = []
-        for deal_title in deal_titles[:10]:
-            for pop_title in popular_titles[:20]:
-                if len(deal_title) > 3 and len(pop_title) > 3:
-                    if deal_title in pop_title or pop_title in deal_title:
-                        partial_matches.append(f"'{deal_title}' ~ '{pop_title}'")
-                        if len(partial_matches) >= 5:
-                            break
+        for deal_title in candidate_deals:
+            for pop_title in candidate_popular:
+                if deal_title in pop_title or pop_title in deal_title:
+                    partial_matches.append(f"'{deal_title}' ~ '{pop_title}'")
+                    if len(partial_matches) >= 5:
+                        break
             if len(partial_matches) >= 5:
                 break
         
@@ -169,6 +159,13 @@ async def debug_intersection_details():
     
     await client.close()
 
+async def main():
+    """Run both debug passes on a single event loop"""
+    try:
+        await debug_intersection_logic()
+        await debug_intersection_details()
+    finally:
+        await close_session()
+
 if __name__ == "__main__":
-    asyncio.run(debug_intersection_logic())
-    asyncio.run(debug_intersection_details())
\ No newline at end of file
+    run_script(main())
\ No newline at end of file
@@ -4,23 +4,70 @@ Debug script to test ITAD popularity endpoints directly
 """
 
 import asyncio
-import aiohttp
-import json
 import sys
 import os
 
+import orjson
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.app_config import load_config
+from config.app_config import CONFIG
+from _session import get_session, close_session
+from _runner import run_script
+
+async def probe(session, endpoint, params, sem):
+    """Fetch one endpoint, returning (endpoint, status, headers, body, parse_error)"""
+    async with sem:
+        async with session.get(endpoint, params=params) as response:
+            headers = dict(response.headers)
+            if response.status == 200:
+                # Read the bytes once and parse with orjson instead of aiohttp's json()
+                raw = await response.read()
+                try:
+                    return endpoint, response.status, headers, orjson.loads(raw), None
+                except orjson.JSONDecodeError as e:
+                    return endpoint, response.status, headers, raw.decode(errors='replace'), e
+            return endpoint, response.status, headers, await response.text(), None
+
+def print_probe_result(endpoint, result):
+    """Pretty-print a single probe result"""
+    print(f"\n=== Testing: {endpoint} ===")
+    
+    if isinstance(result, Exception):
+        print(f"Request Error: {result}")
+        return
+    
+    _, status, headers, body, parse_error = result
+    print(f"Status Code: {status}")
+    print(f"Headers: {headers}")
+    
+    if status != 200:
+        print(f"Error Response: {body[:500]}...")
+        return
+    if parse_error is not None:
+        print(f"JSON Parse Error: {parse_error}")
+        print(f"Raw Response: {body[:500]}...")
+        return
+    
+    print(f"Response Type: {type(body)}")
+    if isinstance(body, list):
+        print(f"List Length: {len(body)}")
+        if body:
+            print(f"First Item Keys: {list(body[0].keys())}")
+            print(f"First Item: {body[0]}")
+    elif isinstance(body, dict):
+        print(f"Dict Keys: {list(body.keys())}")
+        print(f"Response Data: {body}")
+    else:
+        print(f"Unexpected data type: {type(body)}")
+        print(f"Data: {body}")
 
 async def test_popularity_endpoints():
     """Test all popularity endpoints to see which ones work"""
     
-    # Initialize config
-    config = load_config()
     base_url = "https://api.isthereanydeal.com"
-    api_key = config.itad_api_key
+    api_key = CONFIG.itad_api_key
     
     # Test endpoints with different versions
     endpoints_to_test = [
@@ -40,46 +87,26 @@ async def test_popularity_endpoints():
         f"{base_url}/stats/most-collected",
     ]
     
-    async with aiohttp.ClientSession() as session:
-        for endpoint in endpoints_to_test:
-            print(f"\n=== Testing: {endpoint} ===")
-            
-            params = {
-                "key": api_key,
-                "limit": 10,
-                "offset": 0
-            }
-            
-            try:
-                async with session.get(endpoint, params=params) as response:
-                    print(f"Status Code: {response.status}")
-                    print(f"Headers: {dict(response.headers)}")
-                    
-                    if response.status == 200:
-                        try:
-                            data = await response.json()
-                            print(f"Response Type: {type(data)}")
-                            if isinstance(data, list):
-                                print(f"List Length: {len(data)}")
-                                if data:
-                                    print(f"First Item Keys: {list(data[0].keys())}")
-                                    print(f"First Item: {data[0]}")
-                            elif isinstance(data, dict):
-                                print(f"Dict Keys: {list(data.keys())}")
-                                print(f"Response Data: {data}")
-                            else:
-                                print(f"Unexpected data type: {type(data)}")
-                                print(f"Data: {data}")
-                        except Exception as e:
-                            text = await response.text()
-                            print(f"JSON Parse Error: {e}")
-                            print(f"Raw Response: {text[:500]}...")
-                    else:
-                        text = await response.text()
-                        print(f"Error Response: {text[:500]}...")
-                        
-            except Exception as e:
-                print(f"Request Error: {e}")
+    params = {
+        "key": api_key,
+        "limit": 10,
+        "offset": 0
+    }
+    
+    # Overlap the probes but stay under the per-host connection cap
+    sem = asyncio.Semaphore(4)
+    session = await get_session()
+    try:
+        results = await asyncio.gather(
+            *(probe(session, endpoint, params, sem) for endpoint in endpoints_to_test),
+            return_exceptions=True
+        )
+    finally:
+        await close_session()
+    
+    # Print after gather returns so output stays in endpoint order
+    for endpoint, result in zip(endpoints_to_test, results):
+        print_probe_result(endpoint, result)
 
 if __name__ == "__main__":
-    asyncio.run(test_popularity_endpoints())
\ No newline at end of file
+    run_script(test_popularity_endpoints())
\ No newline at end of file
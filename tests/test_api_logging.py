@@ -1,25 +1,40 @@
 #!/usr/bin/env python3
 """
-Test the api_responses.json logging functionality
+Test the api_responses.jsonl logging functionality
 """
 
-import asyncio
-import os
 import sys
-import json
 from pathlib import Path
 
+import pytest
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Keep the script runnable without orjson installed
+    from json import loads as json_loads
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from dotenv import load_dotenv
-from api.itad_client import ITADClient
+from config.app_config import CONFIG
+from api import itad_client
+from api.itad_client import ITADClient, API_LOG_FILE
+from _runner import buffered_stdout, run_script
+
+pytestmark = pytest.mark.integration
+
+
+def read_entries(log_path: Path):
+    """Return the parsed log entries, or None if the log file doesn't exist"""
+    try:
+        return [json_loads(line) for line in log_path.read_bytes().splitlines()]
+    except FileNotFoundError:
+        return None
 
 
 async def test_api_logging():
     """Test that API responses are properly logged"""
-    load_dotenv()
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     
     if not api_key:
         print("❌ No ITAD_API_KEY found")
@@ -29,10 +44,15 @@ async def test_api_logging():
     print("=" * 40)
     
     # Clear existing log file
-    log_file = "logs/api_responses.json"
-    if os.path.exists(log_file):
-        os.remove(log_file)
-        print("🗑️  Cleared existing api_responses.json")
+    log_path = Path(API_LOG_FILE)
+    try:
+        log_path.unlink()
+        print("🗑️  Cleared existing api_responses.jsonl")
+    except FileNotFoundError:
+        pass
+    # Leave any legacy api_responses.json in place; migrating it into the new
+    # log on the first call would skew the entry counts below
+    itad_client._legacy_log_checked = True
     
     client = ITADClient(api_key=api_key)
     
@@ -47,19 +67,18 @@ async def test_api_logging():
         )
         
         # Check if log file was created
-        if os.path.exists(log_file):
-            print("✅ api_responses.json created")
+        log_data = read_entries(log_path)
+        if log_data is not None:
+            print("✅ api_responses.jsonl created")
             
-            with open(log_file, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-                print(f"📊 Log entries: {len(log_data)}")
-                if log_data:
-                    latest_entry = log_data[-1]
-                    print(f"   Timestamp: {latest_entry['timestamp']}")
-                    print(f"   Total items: {latest_entry['response_summary']['total_items']}")
-                    print(f"   First 5 deals stored: {len(latest_entry['first_5_deals'])}")
+            print(f"📊 Log entries: {len(log_data)}")
+            if log_data:
+                latest_entry = log_data[-1]
+                print(f"   Timestamp: {latest_entry['timestamp']}")
+                print(f"   Total items: {latest_entry['response_summary']['total_items']}")
+                print(f"   First 5 deals stored: {len(latest_entry['first_5_deals'])}")
         else:
-            print("❌ api_responses.json not created")
+            print("❌ api_responses.jsonl not created")
         
         # Test 2: Another API call to test appending
         print("\n📝 Test 2: Second API call (should append)")
@@ -71,16 +90,15 @@ async def test_api_logging():
         )
         
         # Check if entries were appended
-        if os.path.exists(log_file):
-            with open(log_file, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-                print(f"📊 Log entries after second call: {len(log_data)}")
-                if len(log_data) >= 2:
-                    print("✅ Entries properly appended")
-                    print(f"   Entry 1 store filter: {log_data[0].get('store_filter', 'None')}")
-                    print(f"   Entry 2 store filter: {log_data[1].get('store_filter', 'None')}")
-                else:
-                    print("❌ Entries not properly appended")
+        log_data = read_entries(log_path)
+        if log_data is not None:
+            print(f"📊 Log entries after second call: {len(log_data)}")
+            if len(log_data) >= 2:
+                print("✅ Entries properly appended")
+                print(f"   Entry 1 store filter: {log_data[0].get('store_filter', 'None')}")
+                print(f"   Entry 2 store filter: {log_data[1].get('store_filter', 'None')}")
+            else:
+                print("❌ Entries not properly appended")
         
         # Test 3: API call without logging (should not add entry)
         print("\n📝 Test 3: API call without logging")
@@ -91,14 +109,13 @@ async def test_api_logging():
         )
         
         # Check that no new entry was added
-        if os.path.exists(log_file):
-            with open(log_file, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-                print(f"📊 Log entries after third call: {len(log_data)}")
-                if len(log_data) == 2:
-                    print("✅ No entry added when logging disabled")
-                else:
-                    print("❌ Entry added when logging should be disabled")
+        log_data = read_entries(log_path)
+        if log_data is not None:
+            print(f"📊 Log entries after third call: {len(log_data)}")
+            if len(log_data) == 2:
+                print("✅ No entry added when logging disabled")
+            else:
+                print("❌ Entry added when logging should be disabled")
         
         print(f"\n🎉 API logging test completed!")
         print(f"   Found {len(deals)} priority deals in test 1")
@@ -114,4 +131,5 @@ async def test_api_logging():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_api_logging())
\ No newline at end of file
+    with buffered_stdout():
+        run_script(test_api_logging())
\ No newline at end of file
@@ -4,18 +4,21 @@ Test the actual bot deals functionality to ensure it works end-to-end
 """
 
 import asyncio
-import os
-from dotenv import load_dotenv
+
+import pytest
+
+from config.app_config import CONFIG
 from api.itad_client import ITADClient
+from _runner import buffered_stdout, run_script
+
+pytestmark = pytest.mark.integration
 
 async def test_bot_deals():
     """Test that the bot can fetch deals successfully"""
     print("🤖 Testing GameDealer Bot Deals Functionality")
     print("=" * 50)
     
-    # Load environment variables
-    load_dotenv()
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     
     if not api_key:
         print("❌ No API key configured")
@@ -34,22 +37,27 @@ async def test_bot_deals():
             {"name": "High priority only", "params": {"limit": 5, "quality_filter": True, "min_priority": 8}},
         ]
         
-        for test_case in test_cases:
+        # Independent queries, so run them together on the client's connection pool
+        results = await asyncio.gather(
+            *(client.fetch_deals(**test_case['params']) for test_case in test_cases),
+            return_exceptions=True
+        )
+        
+        for test_case, deals in zip(test_cases, results):
             print(f"\n📋 {test_case['name']}:")
-            try:
-                deals = await client.fetch_deals(**test_case['params'])
-                print(f"   ✅ Found {len(deals)} deals")
-                
-                if deals:
-                    for i, deal in enumerate(deals[:3], 1):
-                        priority = deal.get('_priority', 'N/A')
-                        priority_text = f" (Priority: {priority})" if priority != 'N/A' else ""
-                        print(f"   {i}. {deal['title']} - {deal['price']} at {deal['store']}{priority_text}")
-                else:
-                    print(f"   ⚠️ No deals found for this test case")
-                    
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
+            if isinstance(deals, Exception):
+                print(f"   ❌ Error: {deals}")
+                continue
+            
+            print(f"   ✅ Found {len(deals)} deals")
+            
+            if deals:
+                for i, deal in enumerate(deals[:3], 1):
+                    priority = deal.get('_priority', 'N/A')
+                    priority_text = f" (Priority: {priority})" if priority != 'N/A' else ""
+                    print(f"   {i}. {deal['title']} - {deal['price']} at {deal['store']}{priority_text}")
+            else:
+                print(f"   ⚠️ No deals found for this test case")
         
         await client.close()
         print("\n🎯 Bot deals functionality test completed!")
@@ -61,9 +69,10 @@ async def test_bot_deals():
         return False
 
 if __name__ == "__main__":
-    success = asyncio.run(test_bot_deals())
-    if success:
-        print("\n✅ Bot deals functionality is working correctly!")
-        print("📢 The /search_deals and /search_store commands should now work properly.")
-    else:
-        print("\n❌ Issues found with bot deals functionality!")
\ No newline at end of file
+    with buffered_stdout():
+        success = run_script(test_bot_deals())
+        if success:
+            print("\n✅ Bot deals functionality is working correctly!")
+            print("📢 The /search_deals and /search_store commands should now work properly.")
+        else:
+            print("\n❌ Issues found with bot deals functionality!")
\ No newline at end of file
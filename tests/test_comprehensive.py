@@ -1,17 +1,15 @@
 ﻿#!/usr/bin/env python3
 """Test the fixed priority search functionality - October 2025"""
-import asyncio
-import os
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
-from dotenv import load_dotenv
+from config.app_config import CONFIG
 from api.itad_client import ITADClient
+from _runner import buffered_stdout, run_script
 
 async def main():
-    load_dotenv()
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     if not api_key:
         print(" No ITAD_API_KEY found")
         return False
@@ -42,4 +40,5 @@ async def main():
     return True
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with buffered_stdout():
+        run_script(main())
@@ -12,10 +12,10 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.game_filters import PriorityGameFilter
 
-def test_database():
+def test_database(priority_filter):
     print("Testing priority games database...")
     
-    pf = PriorityGameFilter()
+    pf = priority_filter
     stats = pf.get_database_stats()
     
     print(f"Total games loaded: {stats['total_games']}")
@@ -39,4 +39,4 @@ def test_database():
         print("❌ No games loaded - database issue!")
 
 if __name__ == "__main__":
-    test_database()
\ No newline at end of file
+    test_database(PriorityGameFilter())
\ No newline at end of file
@@ -7,18 +7,33 @@ import asyncio
 import json
 import os
 import sys
+import unicodedata
+from functools import lru_cache
 
 # Add the project root to Python path so we can import modules
 sys.path.insert(0, os.path.dirname(__file__))
 
+# Symbols (™ ® © ℗ ℠ ⓒ ...) and invisible format characters never affect matching
+_DROP_CATEGORIES = frozenset({'So', 'Cf'})
+
+def _collapse_whitespace(title):
+    """Strip and casefold, only rebuilding the string when it has runs or non-space whitespace"""
+    title = title.strip()
+    # isprintable() is False for tabs, newlines and every Unicode space except ' '
+    if '  ' in title or not title.isprintable():
+        title = ' '.join(title.split())
+    return title.casefold()
+
+@lru_cache(maxsize=4096)
 def normalize_title_for_matching(title):
     """Normalize title by removing special characters that don't affect matching"""
-    import re
-    # Remove trademark, registered, copyright symbols and similar special chars
-    normalized = re.sub(r'[™®©℗℠]', '', title)
-    # Remove extra whitespace and convert to lowercase
-    normalized = ' '.join(normalized.split()).lower().strip()
-    return normalized
+    # Plain ASCII has no symbols or compatibility forms, so only whitespace and case matter
+    if title.isascii():
+        return _collapse_whitespace(title)
+    # Drop symbols before NFKC, which would otherwise expand ™ to "TM"
+    stripped = ''.join(c for c in title if unicodedata.category(c) not in _DROP_CATEGORIES)
+    # Fold compatibility forms (fullwidth letters etc.), collapse whitespace and case
+    return _collapse_whitespace(unicodedata.normalize('NFKC', stripped))
 
 def test_exact_matching():
     """Test the exact matching functionality with real priority games data"""
@@ -48,24 +63,27 @@ def test_exact_matching():
     
     matched_games = []
     
+    # Normalize each priority title once and look deals up by hash
+    priority_by_norm = {
+        normalize_title_for_matching(priority_game.get('title', '').strip()): priority_game
+        for priority_game in priority_games_sample
+    }
+    
     for deal in sample_deals:
         deal_title = deal.get('title', '').strip()
         normalized_deal_title = normalize_title_for_matching(deal_title)
         
-        # Find exact matches in priority database
+        # Find exact match in priority database
         matches = []
-        for priority_game in priority_games_sample:
-            priority_title = priority_game.get('title', '').strip()
-            normalized_priority_title = normalize_title_for_matching(priority_title)
-            
-            if normalized_deal_title == normalized_priority_title:
-                matches.append(priority_game['title'])
-                matched_games.append({
-                    'deal_title': deal_title,
-                    'matched_priority_game': priority_game['title'],
-                    'discount': deal['discount'],
-                    'store': deal['store']
-                })
+        priority_game = priority_by_norm.get(normalized_deal_title)
+        if priority_game is not None:
+            matches.append(priority_game['title'])
+            matched_games.append({
+                'deal_title': deal_title,
+                'matched_priority_game': priority_game['title'],
+                'discount': deal['discount'],
+                'store': deal['store']
+            })
         
         status = "MATCH" if matches else "NO MATCH"
         match_info = f" -> {matches[0]}" if matches else ""
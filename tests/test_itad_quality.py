@@ -3,17 +3,22 @@
 Test the new ITAD quality filtering system
 """
 
-import asyncio
 import os
 import sys
 import logging
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from api.itad_client import ITADClient
+from _runner import buffered_stdout, run_script
+from config.app_config import CONFIG
 from utils.itad_quality import ITADQualityFilter, EnhancedAssetFlipDetector
 
+pytestmark = pytest.mark.integration
+
 # Set up basic logging
 logging.basicConfig(level=logging.INFO)
 
@@ -21,7 +26,7 @@ async def test_quality_system():
     """Test the ITAD quality filtering system"""
     
     # Load API key
-    api_key = os.getenv("ITAD_API_KEY")
+    api_key = CONFIG.itad_api_key
     if not api_key:
         print("❌ ITAD_API_KEY environment variable not set")
         return
@@ -116,4 +121,5 @@ async def test_quality_system():
     print("\n🎉 Testing completed!")
 
 if __name__ == "__main__":
-    asyncio.run(test_quality_system())
\ No newline at end of file
+    with buffered_stdout():
+        run_script(test_quality_system())
\ No newline at end of file
@@ -9,15 +9,18 @@ import asyncio
 import logging
 import sys
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+import pytest
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config.app_config import CONFIG
 from api.itad_client import ITADClient
+from _runner import run_concurrently, run_script
+from _session import close_session, get_session
+
+pytestmark = pytest.mark.integration
 
 
 async def test_native_priority_methods():
@@ -29,13 +32,13 @@ async def test_native_priority_methods():
     logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
     
     # Initialize client with API key
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     if not api_key:
         print("❌ ITAD_API_KEY environment variable not found")
         print("💡 Please set ITAD_API_KEY in your .env file")
         return
     
-    client = ITADClient(api_key=api_key)
+    client = ITADClient(api_key=api_key, session=await get_session())
     
     methods = [
         ("hybrid", "🔥 Hybrid (Combined)"),
@@ -45,29 +48,31 @@ async def test_native_priority_methods():
     ]
     
     try:
-        for method_id, method_name in methods:
+        # Methods are independent, so fetch them together and report in order
+        results = await asyncio.gather(
+            *(client.fetch_native_priority_deals(
+                limit=5,
+                min_discount=30,
+                priority_method=method_id
+            ) for method_id, _ in methods),
+            return_exceptions=True
+        )
+        
+        for (_, method_name), deals in zip(methods, results):
             print(f"\\n{method_name}")
             print("-" * 40)
             
-            try:
-                deals = await client.fetch_native_priority_deals(
-                    limit=5,
-                    min_discount=30,
-                    priority_method=method_id
-                )
-                
-                if deals:
-                    print(f"✅ Found {len(deals)} deals:")
-                    for i, deal in enumerate(deals, 1):
-                        print(f"  {i}. {deal['title']}")
-                        print(f"     Price: {deal['price']} | Discount: {deal.get('discount', 'N/A')}")
-                        print(f"     Store: {deal.get('shop', 'Unknown')}")
-                        print()
-                else:
-                    print("❌ No deals found")
-                    
-            except Exception as e:
-                print(f"❌ Error: {e}")
+            if isinstance(deals, Exception):
+                print(f"❌ Error: {deals}")
+            elif deals:
+                print(f"✅ Found {len(deals)} deals:")
+                for i, deal in enumerate(deals, 1):
+                    print(f"  {i}. {deal['title']}")
+                    print(f"     Price: {deal['price']} | Discount: {deal.get('discount', 'N/A')}")
+                    print(f"     Store: {deal.get('shop', 'Unknown')}")
+                    print()
+            else:
+                print("❌ No deals found")
         
         # Test with store filter
         print("\\n" + "=" * 60)
@@ -101,12 +106,12 @@ async def test_popularity_endpoints():
     print("📊 Testing Individual ITAD Popularity Endpoints")
     print("=" * 60)
     
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     if not api_key:
         print("❌ ITAD_API_KEY environment variable not found")
         return
     
-    client = ITADClient(api_key=api_key)
+    client = ITADClient(api_key=api_key, session=await get_session())
     
     endpoints = [
         ("most-popular", "📈 Most Popular Games"),
@@ -150,12 +155,12 @@ async def test_quality_vs_native():
     print("🔄 Comparing Quality vs Native Priority Methods")
     print("=" * 60)
     
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     if not api_key:
         print("❌ ITAD_API_KEY environment variable not found")
         return
     
-    client = ITADClient(api_key=api_key)
+    client = ITADClient(api_key=api_key, session=await get_session())
     
     try:
         # Test quality method
@@ -192,7 +197,14 @@ async def test_quality_vs_native():
         print("\\n🏁 Comparison completed")
 
 
+async def main():
+    """Run both independent checks concurrently on a single event loop and connection pool"""
+    try:
+        await run_concurrently(test_native_priority_methods, test_quality_vs_native)
+    finally:
+        await close_session()
+
+
 if __name__ == "__main__":
     # Run the tests
-    asyncio.run(test_native_priority_methods())
-    asyncio.run(test_quality_vs_native())
\ No newline at end of file
+    run_script(main())
\ No newline at end of file
@@ -0,0 +1,49 @@
+# tests/test_offline_deals.py
+"""
+Offline checks for ITADClient.fetch_deals against a canned ITAD response
+
+Run just these with: pytest tests/ -m offline
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from api.itad_client import ITADClient
+from _offline import offline_itad
+
+pytestmark = pytest.mark.offline
+
+
+async def fetch_offline(payload, **kwargs):
+    """Run fetch_deals with the client pointed at a local server"""
+    async with offline_itad(payload) as base_url:
+        client = ITADClient(api_key="offline-test-key")
+        client.BASE = base_url
+        try:
+            return await client.fetch_deals(**kwargs)
+        finally:
+            await client.close()
+
+
+def test_fetch_deals_parses_and_filters_by_discount(itad_payload):
+    deals = asyncio.run(fetch_offline(itad_payload, min_discount=50, limit=10, quality_filter=False))
+
+    assert [deal['title'] for deal in deals] == ["The Witcher 3: Wild Hunt", "Hades", "Cyberpunk 2077"]
+    witcher = deals[0]
+    assert witcher['store'] == "GOG"
+    assert witcher['price'] == "$7.99"
+    assert witcher['original_price'] == "$39.99"
+    assert witcher['discount'] == "80%"
+    assert [deal['discount_pct'] for deal in deals] == [80, 60, 50]
+    assert deals[1]['store'] == "Epic Game Store"
+
+
+def test_fetch_deals_store_filter(itad_payload):
+    deals = asyncio.run(fetch_offline(itad_payload, min_discount=10, store_filter="Steam", quality_filter=False))
+
+    assert [deal['title'] for deal in deals] == ["Baldur's Gate 3", "Cyberpunk 2077"]
+    assert all(deal['store'] == "Steam" for deal in deals)
@@ -4,21 +4,25 @@ Test script to verify the new priority-based sorting logic.
 """
 
 import asyncio
-import os
 import sys
+from itertools import pairwise
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from dotenv import load_dotenv
+from config.app_config import CONFIG
 from api.itad_client import ITADClient
+from _runner import buffered_stdout, run_script
+
+pytestmark = pytest.mark.integration
 
 
 async def test_priority_sorting():
     """Test the priority-based sorting with different scenarios"""
-    load_dotenv()
-    api_key = os.getenv('ITAD_API_KEY')
+    api_key = CONFIG.itad_api_key
     
     if not api_key:
         print("❌ No ITAD_API_KEY found")
@@ -30,15 +34,24 @@ async def test_priority_sorting():
         print("🧪 Testing Priority-Based Sorting Logic")
         print("=" * 50)
         
-        # Get deals with various discount levels
-        print("\n📊 Getting deals with 10%+ discount (should prioritize discount first)")
-        low_discount_deals = await client.fetch_deals(
-            min_discount=10,
-            limit=5,
-            quality_filter=True,
-            min_priority=5
+        # Get deals with various discount levels; the two queries are independent
+        low_discount_deals, high_discount_deals = await asyncio.gather(
+            client.fetch_deals(
+                min_discount=10,
+                limit=5,
+                quality_filter=True,
+                min_priority=5
+            ),
+            client.fetch_deals(
+                min_discount=50,
+                limit=8,
+                quality_filter=True,
+                min_priority=5
+            )
         )
         
+        print("\n📊 Getting deals with 10%+ discount (should prioritize discount first)")
+        
         print("Low discount deals (discount priority):")
         for i, deal in enumerate(low_discount_deals, 1):
             priority = deal.get('_priority', 'N/A')
@@ -47,12 +60,6 @@ async def test_priority_sorting():
             print(f"  {i}. {title:<35} | Priority: {priority:>2} | Discount: {discount:>5}")
         
         print("\n🔥 Getting deals with 50%+ discount (should prioritize priority first)")
-        high_discount_deals = await client.fetch_deals(
-            min_discount=50,
-            limit=8,
-            quality_filter=True,
-            min_priority=5
-        )
         
         print("High discount deals (priority first):")
         for i, deal in enumerate(high_discount_deals, 1):
@@ -67,7 +74,7 @@ async def test_priority_sorting():
         # Check high discount deals are sorted by priority first
         if len(high_discount_deals) >= 2:
             priorities = [deal.get('_priority', 0) for deal in high_discount_deals]
-            is_priority_sorted = all(priorities[i] >= priorities[i+1] for i in range(len(priorities)-1))
+            is_priority_sorted = all(a >= b for a, b in pairwise(priorities))
             
             if is_priority_sorted:
                 print("✅ High discount deals correctly sorted by priority")
@@ -78,6 +85,7 @@ async def test_priority_sorting():
         print(f"\n📈 Summary:")
         print(f"   Low discount deals found: {len(low_discount_deals)}")
         print(f"   High discount deals found: {len(high_discount_deals)}")
+        print(f"   Deals above 50% discount: {sum(1 for deal in high_discount_deals if deal['discount_pct'] > 50)}")
         
         # Test specific example scenario from user request
         print(f"\n🎯 Example scenario verification:")
@@ -92,4 +100,5 @@ async def test_priority_sorting():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_priority_sorting())
\ No newline at end of file
+    with buffered_stdout():
+        run_script(test_priority_sorting())
\ No newline at end of file
@@ -6,71 +6,85 @@ Test the actual native_priority command result
 import asyncio
 import sys
 import os
+from operator import itemgetter
+
+import pytest
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from api.itad_client import ITADClient
-from config.app_config import load_config
+from config.app_config import CONFIG
+from _runner import buffered_stdout, run_script
+
+pytestmark = pytest.mark.integration
+
+# Keys every native priority deal carries
+deal_fields = itemgetter('title', 'store', 'price', 'url')
 
 async def test_native_priority_results():
     """Test what users actually see from the native_priority command"""
     
     # Initialize client
-    config = load_config()
-    client = ITADClient(config.itad_api_key)
+    client = ITADClient(CONFIG.itad_api_key)
     
     print("=== TESTING NATIVE PRIORITY RESULTS ===\n")
     
     try:
-        # Test the exact scenario users are experiencing
-        print("Testing: limit=15, no store filter (default Steam/Epic/GOG)")
+        methods = ["popular_deals", "collected_deals", "waitlisted_deals"]
         
-        results = await client.fetch_native_priority_deals(
-            limit=15,
-            min_discount=0,
-            priority_method="hybrid",
-            store_filter=None  # This should trigger default filtering
+        # Every query below is independent, so fetch them all together
+        results, steam_results, *methods_results = await asyncio.gather(
+            client.fetch_native_priority_deals(
+                limit=15,
+                min_discount=0,
+                priority_method="hybrid",
+                store_filter=None  # This should trigger default filtering
+            ),
+            client.fetch_native_priority_deals(
+                limit=15,
+                min_discount=0,
+                priority_method="hybrid",
+                store_filter="Steam"
+            ),
+            *(client.fetch_native_priority_deals(
+                limit=10,
+                min_discount=0,
+                priority_method=method,
+                store_filter=None
+            ) for method in methods)
         )
         
+        # Test the exact scenario users are experiencing
+        print("Testing: limit=15, no store filter (default Steam/Epic/GOG)")
+        
         print(f"\nResults: {len(results)} deals returned")
         print("\nDetailed results:")
         for i, deal in enumerate(results, 1):
-            print(f"{i:2d}. {deal['title']}")
-            print(f"    {deal.get('discount', 'N/A')} off • {deal['store']} • ${deal['price']}")
-            print(f"    {deal['url']}")
+            title, store, price, url = deal_fields(deal)
+            print(f"{i:2d}. {title}")
+            print(f"    {deal.get('discount', 'N/A')} off • {store} • ${price}")
+            print(f"    {url}")
             print()
         
         # Test with explicit Steam filter
         print("\n" + "="*50)
         print("Testing: limit=15, explicit Steam filter")
         
-        steam_results = await client.fetch_native_priority_deals(
-            limit=15,
-            min_discount=0,
-            priority_method="hybrid",
-            store_filter="Steam"
-        )
-        
         print(f"\nSteam Results: {len(steam_results)} deals returned")
         print("\nSteam detailed results:")
         for i, deal in enumerate(steam_results, 1):
-            print(f"{i:2d}. {deal['title']}")
-            print(f"    {deal.get('discount', 'N/A')} off • {deal['store']} • ${deal['price']}")
+            title, store, price, _ = deal_fields(deal)
+            print(f"{i:2d}. {title}")
+            print(f"    {deal.get('discount', 'N/A')} off • {store} • ${price}")
             print()
         
         # Test individual priority methods
         print("\n" + "="*50)
         print("Testing individual priority methods:")
         
-        for method in ["popular_deals", "collected_deals", "waitlisted_deals"]:
+        for method, method_results in zip(methods, methods_results):
             print(f"\n--- {method.upper()} ---")
-            method_results = await client.fetch_native_priority_deals(
-                limit=10,
-                min_discount=0,
-                priority_method=method,
-                store_filter=None
-            )
             print(f"Results: {len(method_results)} deals")
             for deal in method_results[:3]:
                 print(f"  • {deal['title']} ({deal.get('discount', 'N/A')} off)")
@@ -83,4 +97,5 @@ async def test_native_priority_results():
     await client.close()
 
 if __name__ == "__main__":
-    asyncio.run(test_native_priority_results())
\ No newline at end of file
+    with buffered_stdout():
+        run_script(test_native_priority_results())
\ No newline at end of file
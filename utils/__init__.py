@@ -1,14 +1,33 @@
 # utils/__init__.py
 """Utility functions for GameDealer bot"""
 
-from .embeds import make_startup_embed, make_deal_embed
-from .game_filters import (
-    PriorityGameFilter, GameQualityFilter, 
-    is_priority_game, filter_priority_games, get_priority_score
-)
-
-__all__ = [
-    'make_startup_embed', 'make_deal_embed', 
-    'PriorityGameFilter', 'GameQualityFilter',
-    'is_priority_game', 'filter_priority_games', 'get_priority_score'
-]
\ No newline at end of file
+import importlib
+from typing import Any, List
+
+# Re-exported names and the submodule defining each; imported on first access
+# so that loading one submodule (e.g. utils.embeds) doesn't pull in the rest
+_LAZY = {
+    'make_startup_embed': 'embeds',
+    'make_deal_embed': 'embeds',
+    'PriorityGameFilter': 'game_filters',
+    'GameQualityFilter': 'game_filters',
+    'is_priority_game': 'game_filters',
+    'filter_priority_games': 'game_filters',
+    'get_priority_score': 'game_filters',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
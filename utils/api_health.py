@@ -1,14 +1,35 @@
 # utils/api_health.py
 import asyncio
+import time
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
 class APIHealthChecker:
     """Simple utility to check ITAD API health status"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://api.isthereanydeal.com"
+        # A passed-in session is borrowed: reused for checks but never closed here
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session: bool = session is None
+        # Validator from the last response, sent back so an unchanged reply is a bodyless 304
+        self._last_etag: Optional[str] = None
+    
+    async def start(self) -> aiohttp.ClientSession:
+        """Open the pooled session reused by every check (called lazily if needed)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            )
+            self._owns_session = True
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the session if this checker opened it"""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
     
     async def check_api_status(self) -> Dict[str, Any]:
         """Check if ITAD API is responding properly"""
@@ -21,38 +42,44 @@ class APIHealthChecker:
         }
         
         try:
-            import time
+            session = await self.start()
             start_time = time.time()
             
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Try a simple API endpoint
-                test_url = f"{self.base_url}/v01/game/plain/"
-                params = {"key": "test", "title": "Test Game"}
+            # Try a simple API endpoint
+            test_url = f"{self.base_url}/v01/game/plain/"
+            params = {"key": "test", "title": "Test Game"}
+            headers = {"If-None-Match": self._last_etag} if self._last_etag else {}
+            
+            async with session.get(test_url, params=params, headers=headers) as response:
+                end_time = time.time()
+                status["response_time_ms"] = int((end_time - start_time) * 1000)
+                status["status_code"] = response.status
+                status["content_type"] = response.content_type
                 
-                async with session.get(test_url, params=params) as response:
-                    end_time = time.time()
-                    status["response_time_ms"] = int((end_time - start_time) * 1000)
-                    status["status_code"] = response.status
-                    status["content_type"] = response.content_type
-                    
-                    if response.status == 200:
-                        # Check if we get JSON back (even if it's an error response)
-                        if 'application/json' in response.content_type:
-                            status["available"] = True
-                        else:
-                            status["error_message"] = f"API returned non-JSON content: {response.content_type}"
-                    elif response.status == 403:
-                        # API key error is still a "healthy" API response
+                if response.status == 304:
+                    # Unchanged since the last check, which was a healthy response
+                    status["available"] = True
+                elif response.status == 200:
+                    # Check if we get JSON back (even if it's an error response)
+                    if 'application/json' in response.content_type:
                         status["available"] = True
-                        status["error_message"] = "API key required (but API is responding)"
-                    elif response.status >= 500:
-                        status["error_message"] = f"Server error: HTTP {response.status}"
-                        if response.status == 502:
-                            status["error_message"] += " (Bad Gateway - service may be down)"
                     else:
-                        status["error_message"] = f"HTTP {response.status}"
-                        
+                        status["error_message"] = f"API returned non-JSON content: {response.content_type}"
+                elif response.status == 403:
+                    # API key error is still a "healthy" API response
+                    status["available"] = True
+                    status["error_message"] = "API key required (but API is responding)"
+                elif response.status >= 500:
+                    status["error_message"] = f"Server error: HTTP {response.status}"
+                    if response.status == 502:
+                        status["error_message"] += " (Bad Gateway - service may be down)"
+                else:
+                    status["error_message"] = f"HTTP {response.status}"
+                
+                # Only a healthy response may be revalidated by a later 304
+                if response.status != 304:
+                    self._last_etag = response.headers.get("ETag") if status["available"] else None
+                    
         except asyncio.TimeoutError:
             status["error_message"] = "Request timeout (>10s)"
         except aiohttp.ClientConnectionError as e:
@@ -80,7 +107,10 @@ class APIHealthChecker:
 async def quick_api_check() -> None:
     """Standalone function for quick API health check"""
     checker = APIHealthChecker()
-    status = await checker.check_api_status()
+    try:
+        status = await checker.check_api_status()
+    finally:
+        await checker.close()
     print(checker.format_status_message(status))
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+# utils/deal_cache.py
+"""
+Short-lived in-memory cache for deal query results
+"""
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+from models import Deal
+
+
+class DealCache:
+    """Cache deal lists by query key for a short time to avoid repeat API calls"""
+
+    def __init__(self, cache_duration: float = 300) -> None:
+        self.cache_duration = cache_duration  # seconds
+        self._entries: Dict[Hashable, Tuple[float, List[Deal]]] = {}
+
+    def get(self, key: Hashable) -> Optional[List[Deal]]:
+        """Return cached deals for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, deals = entry
+        if time.monotonic() - stored_at >= self.cache_duration:
+            del self._entries[key]
+            return None
+        return deals
+
+    def set(self, key: Hashable, deals: List[Deal]) -> None:
+        """Store deals for key, dropping any entries that have expired"""
+        now = time.monotonic()
+        self._purge_expired(now)
+        # Re-insert rather than overwrite so entries stay in the order they were stored
+        self._entries.pop(key, None)
+        self._entries[key] = (now, deals)
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired entries so one-off queries don't linger until requested again"""
+        # Entries are kept oldest first, so the expired ones are all at the front
+        expired = []
+        for key, (stored_at, _) in self._entries.items():
+            if now - stored_at < self.cache_duration:
+                break
+            expired.append(key)
+        for key in expired:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
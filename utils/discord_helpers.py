@@ -4,9 +4,13 @@ Discord interaction and context handling utilities
 """
 import discord
 from discord.ext import commands
+from operator import itemgetter
 from typing import Optional, Union, Any, Protocol
 import logging
 
+from models import canonical_store
+from .embeds import make_deal_embed
+
 class InteractionLike(Protocol):
     """Protocol for unified interaction/context handling"""
     async def send_message(self, content: Optional[str] = None, embed: Optional[discord.Embed] = None, ephemeral: bool = False) -> None: ...
@@ -79,6 +83,9 @@ class InteractionWrapper:
         except Exception as e:
             logging.error(f"Failed to defer interaction: {e}")
 
+# Fields every deal carries, fetched together for the text-only listing
+_deal_fields = itemgetter('title', 'price', 'store', 'url')
+
 class DealDisplayHelper:
     """Helper for displaying deals consistently"""
     
@@ -100,7 +107,6 @@ class DealDisplayHelper:
         
         for page_num, page_deals in enumerate(pages):
             if use_embeds:
-                from utils.embeds import make_deal_embed
                 embed = make_deal_embed(page_deals, title)
                 
                 if page_num == 0:
@@ -109,12 +115,16 @@ class DealDisplayHelper:
                     await wrapper.followup_send(embed=embed)
             else:
                 # Text-only fallback
-                deal_text = f"**{title}**\n\n"
+                lines = [f"**{title}**", ""]
                 for i, deal in enumerate(page_deals, 1 + (page_num * max_per_page)):
-                    discount_text = f" ({deal.get('discount', 'N/A')} off)" if deal.get('discount') else ""
-                    deal_text += f"{i}. **{deal['title']}**{discount_text}\n"
-                    deal_text += f"   💰 {deal['price']} • 🏪 {deal['store']}\n"
-                    deal_text += f"   🔗 {deal['url']}\n\n"
+                    deal_title, price, store, url = _deal_fields(deal)
+                    discount = deal.get('discount')
+                    discount_text = f" ({discount} off)" if discount else ""
+                    lines.append(f"{i}. **{deal_title}**{discount_text}")
+                    lines.append(f"   💰 {price} • 🏪 {store}")
+                    lines.append(f"   🔗 {url}")
+                    lines.append("")
+                deal_text = "\n".join(lines)
                 
                 if page_num == 0:
                     await wrapper.edit_response(content=deal_text)
@@ -134,30 +144,9 @@ def validate_store_filter(store: Optional[str]) -> tuple[Optional[str], Optional
     if not store:
         return None, None
     
-    # Normalize common store names
-    store_mappings = {
-        "epic": "Epic Game Store",
-        "steam": "Steam", 
-        "gog": "GOG",
-        "humble": "Humble Store",
-        "gmg": "Green Man Gaming",
-        "xbox": "Microsoft Store",
-        "playstation": "PlayStation Store",
-        "nintendo": "Nintendo eShop"
-    }
-    
-    normalized = store_mappings.get(store.lower(), store)
-    
-    # List of supported stores for validation
-    supported_stores = [
-        "Steam", "Epic Game Store", "GOG", "Humble Store",
-        "Fanatical", "Green Man Gaming", "Microsoft Store",
-        "PlayStation Store", "Nintendo eShop", "Battle.net", "itch.io"
-    ]
-    
-    # Check if it's a supported store (case-insensitive)
-    for supported in supported_stores:
-        if normalized.lower() == supported.lower():
-            return supported, None
+    # Store names and aliases come from models.STORE_ALIASES / VALID_STORES
+    canonical = canonical_store(store)
+    if canonical is not None:
+        return canonical, None
     
     return store, f"⚠️ Unknown store: {store}. Using anyway, but results may be limited."
\ No newline at end of file
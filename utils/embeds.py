@@ -1,7 +1,10 @@
 # utils/embeds.py
+import time
 import discord
 from datetime import datetime, timezone
-from typing import Union, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Union, Optional, Tuple
 from models import Deal
 
 GREEN: int = 0x00FF00
@@ -9,12 +12,52 @@ ORANGE: int = 0xFF6B35
 RED: int = 0xE74C3C
 BLUE: int = 0x3498DB
 
+DEAL_FOOTER_TEXT: str = "Powered by IsThereAnyDeal"
+
+# (minimum discount, embed color, footer prefix), checked from the top
+_DISCOUNT_TIERS: Tuple[Tuple[int, int, str], ...] = (
+    (80, RED, "🔥 MEGA DEAL! • "),    # Amazing deal
+    (60, GREEN, "⭐ GREAT DEAL! • "),  # Great deal
+)
+_DEFAULT_TIER: Tuple[int, str] = (BLUE, "")  # Good deal
+
+@lru_cache(maxsize=128)
+def _tier(discount: str) -> Optional[Tuple[int, str]]:
+    """Embed color and footer prefix for a discount string, or None if it isn't a percentage"""
+    try:
+        discount_num = int(discount.replace('%', ''))
+    except ValueError:
+        return None
+    for minimum, color, footer_prefix in _DISCOUNT_TIERS:
+        if discount_num >= minimum:
+            return color, footer_prefix
+    return _DEFAULT_TIER
+
+_TIMESTAMP_RESOLUTION: float = 0.05  # seconds; plenty for embed timestamps
+_last_timestamp: tuple = (float("-inf"), None)
+
+def now_utc() -> datetime:
+    """Current UTC time, reused for embeds built within the same 50ms"""
+    global _last_timestamp
+    tick = time.monotonic()
+    if tick - _last_timestamp[0] < _TIMESTAMP_RESOLUTION:
+        return _last_timestamp[1]
+    now = datetime.now(timezone.utc)
+    _last_timestamp = (tick, now)
+    return now
+
+# Static parts of every deal embed; copied per call and loaded with Embed.from_dict
+_DEAL_EMBED_TEMPLATE = MappingProxyType({
+    "type": "rich",
+    "color": ORANGE,
+})
+
 def make_startup_embed(user: Union[discord.User, discord.Member, discord.abc.User]) -> discord.Embed:
     """Create a startup embed with proper type safety"""
     e = discord.Embed(
         title="✅ Bot online",
         description="GameDealer is running and ready to post deals.",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_utc(),
         color=GREEN,
     )
     e.set_footer(text=f"Logged in as {user}")
@@ -29,25 +72,13 @@ def make_deal_embed(deal_data: Deal) -> discord.Embed:
     discount: Optional[str] = deal_data.get("discount")
     original_price: Optional[str] = deal_data.get("original_price")
 
-    # Choose color based on discount percentage
-    color: int = ORANGE  # default
-    if discount:
-        try:
-            discount_num = int(discount.replace('%', ''))
-            if discount_num >= 80:
-                color = RED  # Amazing deal
-            elif discount_num >= 60:
-                color = GREEN  # Great deal
-            else:
-                color = BLUE  # Good deal
-        except (ValueError, AttributeError):
-            pass
+    data = dict(_DEAL_EMBED_TEMPLATE)
+    data["title"] = f"🎮 {title}"
 
-    embed = discord.Embed(
-        title=f"🎮 {title}",
-        color=color,
-        timestamp=datetime.now(timezone.utc),
-    )
+    # Choose color and footer badge based on discount percentage
+    tier = _tier(discount) if isinstance(discount, str) and discount else None
+    if tier is not None:
+        data["color"] = tier[0]
     
     # Enhanced price display
     price_field = f"**Current Price:** {price}"
@@ -55,35 +86,31 @@ def make_deal_embed(deal_data: Deal) -> discord.Embed:
         price_field += f"\n**Original Price:** ~~{original_price}~~"
         price_field += f"\n**Discount:** {discount} OFF!"
     
-    embed.add_field(name="💰 Price", value=price_field, inline=True)
-    embed.add_field(name="🏪 Store", value=store, inline=True)
-    
+    fields = [
+        {"name": "💰 Price", "value": price_field, "inline": True},
+        {"name": "🏪 Store", "value": store, "inline": True},
+    ]
     if url:
-        embed.add_field(name="🔗 Link", value=f"[Get This Deal]({url})", inline=False)
+        fields.append({"name": "🔗 Link", "value": f"[Get This Deal]({url})", "inline": False})
+    data["fields"] = fields
     
     # Add discount indicator in footer
-    footer_text = "Powered by IsThereAnyDeal"
-    if discount:
-        try:
-            discount_num = int(discount.replace('%', ''))
-            if discount_num >= 80:
-                footer_text = "🔥 MEGA DEAL! • " + footer_text
-            elif discount_num >= 60:
-                footer_text = "⭐ GREAT DEAL! • " + footer_text
-        except (ValueError, AttributeError):
-            pass
+    footer_text = DEAL_FOOTER_TEXT
+    if tier is not None:
+        footer_text = tier[1] + footer_text
+    data["footer"] = {"text": footer_text}
     
-    embed.set_footer(text=footer_text)
+    embed = discord.Embed.from_dict(data)
+    embed.timestamp = now_utc()
     return embed
 
-
 def create_deals_embed(deals: list, title: str, description: str, footer_text: str = None) -> discord.Embed:
     """Create an embed showing multiple deals"""
     embed = discord.Embed(
         title=title,
         description=description,
         color=GREEN,
-        timestamp=datetime.now(timezone.utc)
+        timestamp=now_utc()
     )
     
     for i, deal in enumerate(deals[:10], 1):  # Limit to 10 deals
@@ -116,7 +143,7 @@ def create_error_embed(title: str, description: str) -> discord.Embed:
         title=f"❌ {title}",
         description=description,
         color=RED,
-        timestamp=datetime.now(timezone.utc)
+        timestamp=now_utc()
     )
     return embed
 
@@ -127,6 +154,6 @@ def create_no_deals_embed(title: str, description: str) -> discord.Embed:
         title=f"😔 {title}",
         description=description,
         color=ORANGE,
-        timestamp=datetime.now(timezone.utc)
+        timestamp=now_utc()
     )
     return embed
\ No newline at end of file
@@ -5,10 +5,122 @@ Uses a curated database of prioritized games for accurate filtering.
 """
 
 import json
+import logging
 import os
-from typing import List, Dict, Any, Optional, Tuple, Union, Pattern
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, NamedTuple, Optional, Set, Tuple, Union, Pattern
 import re
-from models import Deal, PriorityGame, FilterResult, DatabaseStats
+from models import Deal, PriorityGame, FilterResult, DatabaseStats, deal_discount
+
+log = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+
+# Filter out common/meaningless words that shouldn't count for matching
+# These words are too common and lead to false matches
+_MEANINGLESS_WORDS = frozenset({
+    'the', 'of', 'and', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 
+    'from', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had',
+    '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'i', 'ii', 'iii', 'iv', 'v',
+    'game', 'edition', 'complete', 'definitive', 'ultimate', 'deluxe', 'premium',
+    'remaster', 'remastered', 'remake', 'hd', 'collection', 'wild', 'new', 'original',
+    'special', 'enhanced', 'director', 'directors', 'gold', 'silver', 'platinum',
+    'standard', 'goty', 'bundle', 'pack', 'set', 'simulator', 'sim', 'magic', 'super',
+    'mega', 'ultra', 'extreme', 'classic', 'legendary', 'epic', 'pro', 'plus', 'max',
+    'mini', 'tiny', 'small', 'big', 'large', 'great', 'grand', 'royal', 'master'
+})
+
+# Also filter out very short words (2 characters or less) as they're too generic
+# Examples: "MAG", "VI", "XI", etc.
+_SHORT_WORD_THRESHOLD = 3
+
+# Distinct search titles remembered per filter; the oldest entry is evicted first
+_MATCH_CACHE_SIZE = 4096
+
+
+def _meaningful_words(title: str) -> Set[str]:
+    """Words of a lowercased title that are allowed to count towards a match"""
+    return {word for word in _WORD_RE.findall(title)
+            if word not in _MEANINGLESS_WORDS and len(word) >= _SHORT_WORD_THRESHOLD}
+
+
+class _TitleIndex(NamedTuple):
+    """Lookup tables built once per database load for find_matching_games"""
+    titles: Tuple[str, ...]  # lowercased titles, aligned with the games tuple
+    priorities: Tuple[int, ...]  # priority of each game, aligned with titles
+    exact: Mapping[str, Tuple[int, ...]]  # lowercased title -> game indices
+    by_word: Mapping[str, Tuple[int, ...]]  # meaningful word -> game indices
+
+
+_EMPTY_INDEX = _TitleIndex((), (), MappingProxyType({}), MappingProxyType({}))
+
+
+@lru_cache(maxsize=1)
+def _load_priority_db(path: str, mtime: float) -> Tuple[Tuple[PriorityGame, ...], Dict[str, Any]]:
+    """
+    Load and parse the priority games database at path.
+
+    The parsed snapshot is shared by every PriorityGameFilter in the process.
+    It is keyed by the file's mtime so edits on disk are picked up; call
+    _load_priority_db.cache_clear() to force a fresh read. Errors are raised
+    rather than returned so that a failed load is never cached.
+
+    Returns:
+        Tuple of (games, metadata) where metadata holds the remaining top-level keys
+    """
+    # Try multiple encoding strategies to handle BOM and encoding issues
+    encodings_to_try: List[str] = ['utf-8-sig', 'utf-8', 'ascii', 'latin-1']
+
+    data = None
+    for encoding in encodings_to_try:
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                data = json.load(f)
+                break
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+
+    if data is None:
+        # If all encodings fail, try reading as binary and removing BOM manually
+        with open(path, 'rb') as f:
+            content = f.read()
+            # Remove UTF-8 BOM if present
+            if content.startswith(b'\xef\xbb\xbf'):
+                content = content[3:]
+            # Try to decode and parse
+            data = json.loads(content.decode('utf-8'))
+
+    games = tuple(data.get('games', []))
+    metadata = MappingProxyType({k: v for k, v in data.items() if k != 'games'})
+    return games, metadata
+
+
+@lru_cache(maxsize=1)
+def _build_title_index(path: str, mtime: float) -> _TitleIndex:
+    """
+    Index the database titles so a lookup only scores plausible candidates.
+
+    Any non-exact match needs at least one shared meaningful word, so the
+    games sharing a word with the search title are the only ones worth scoring.
+    """
+    games, _ = _load_priority_db(path, mtime)
+    titles = tuple(game['title'].lower().strip() for game in games)
+    priorities = tuple(game.get('priority', 0) for game in games)
+    exact: Dict[str, List[int]] = {}
+    by_word: Dict[str, List[int]] = {}
+    for i, title in enumerate(titles):
+        exact.setdefault(title, []).append(i)
+        for word in _meaningful_words(title):
+            by_word.setdefault(word, []).append(i)
+    return _TitleIndex(
+        titles,
+        priorities,
+        MappingProxyType({k: tuple(v) for k, v in exact.items()}),
+        MappingProxyType({k: tuple(v) for k, v in by_word.items()})
+    )
 
 
 class PriorityGameFilter:
@@ -30,53 +142,42 @@ class PriorityGameFilter:
             priority_db_path = os.path.join(project_root, "data", "priority_games.json")
         
         self.priority_db_path: str = priority_db_path
-        self.priority_games: List[PriorityGame] = self._load_priority_games()
+        self.priority_games: Tuple[PriorityGame, ...] = self._load_priority_games()
         
-    def _load_priority_games(self) -> List[PriorityGame]:
-        """Load the priority games database from JSON file."""
+    def _load_priority_games(self) -> Tuple[PriorityGame, ...]:
+        """Load the priority games database and title index from the shared cached snapshot."""
+        self._title_index = _EMPTY_INDEX
+        # Matches are only valid for the database they were computed against
+        self._match_cache: Dict[str, Tuple[Tuple[PriorityGame, float], ...]] = {}
         try:
-            if not os.path.exists(self.priority_db_path):
-                print(f"Warning: Priority games database not found at {self.priority_db_path}")
-                return []
-            
-            # Try multiple encoding strategies to handle BOM and encoding issues
-            encodings_to_try: List[str] = ['utf-8-sig', 'utf-8', 'ascii', 'latin-1']
-            
-            for encoding in encodings_to_try:
-                try:
-                    with open(self.priority_db_path, 'r', encoding=encoding) as f:
-                        data = json.load(f)
-                        return data.get('games', [])
-                except (UnicodeDecodeError, json.JSONDecodeError):
-                    continue
-            
-            # If all encodings fail, try reading as binary and removing BOM manually
-            with open(self.priority_db_path, 'rb') as f:
-                content = f.read()
-                # Remove UTF-8 BOM if present
-                if content.startswith(b'\xef\xbb\xbf'):
-                    content = content[3:]
-                # Try to decode and parse
-                data = json.loads(content.decode('utf-8'))
-                return data.get('games', [])
-                
+            mtime = os.path.getmtime(self.priority_db_path)
+            games, _ = _load_priority_db(self.priority_db_path, mtime)
+            self._title_index = _build_title_index(self.priority_db_path, mtime)
+            return games
+        except FileNotFoundError:
+            log.warning("Priority games database not found at %s", self.priority_db_path)
+            return ()
         except Exception as e:
-            print(f"Error loading priority games database: {e}")
-            return []
+            log.error("Error loading priority games database: %s", e)
+            return ()
     
     def reload_database(self) -> bool:
         """Reload the priority games database. Returns True if successful."""
         try:
+            _load_priority_db.cache_clear()
+            _build_title_index.cache_clear()
             self.priority_games = self._load_priority_games()
             return True
         except Exception as e:
-            print(f"Error reloading priority games database: {e}")
+            log.error("Error reloading priority games database: %s", e)
             return False
     
     def find_matching_games(self, game_title: str) -> List[Tuple[Dict[str, Any], float]]:
         """
         Find games in the priority database that match the given title.
         
+        Results are memoized per lowercased title until the database is reloaded.
+        
         Args:
             game_title: The game title to search for
             
@@ -86,20 +187,34 @@ class PriorityGameFilter:
         if not self.priority_games:
             return []
         
-        matches = []
         title_lower = game_title.lower().strip()
+        cached = self._match_cache.get(title_lower)
+        if cached is not None:
+            return list(cached)
         
-        for game in self.priority_games:
-            game_title_lower = game['title'].lower().strip()
-            
+        index = self._title_index
+        scored = []  # (priority, match_score, game index), read from the index's parallel columns
+        
+        # Only exact titles and games sharing a meaningful word can score above 0
+        candidates = set(index.exact.get(title_lower, ()))
+        for word in _meaningful_words(title_lower):
+            candidates.update(index.by_word.get(word, ()))
+        
+        # Score in database order so ties sort the same as a full scan
+        for i in sorted(candidates):
             # Calculate match score
-            match_score = self._calculate_match_score(title_lower, game_title_lower)
+            match_score = self._calculate_match_score(title_lower, index.titles[i])
             
             if match_score > 0:
-                matches.append((game, match_score))
+                scored.append((index.priorities[i], match_score, i))
         
         # Sort by priority (descending) then by match score (descending)
-        matches.sort(key=lambda x: (x[0]['priority'], x[1]), reverse=True)
+        scored.sort(key=itemgetter(0, 1), reverse=True)
+        matches = [(self.priority_games[i], match_score) for _, match_score, i in scored]
+        
+        if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+            del self._match_cache[next(iter(self._match_cache))]
+        self._match_cache[title_lower] = tuple(matches)
         
         return matches
     
@@ -121,35 +236,17 @@ class PriorityGameFilter:
         # Only allow exact word-based matching from this point forward
         
         # Split into words for word-based matching
-        search_words = set(re.findall(r'\w+', search_title))
-        db_words = set(re.findall(r'\w+', db_title))
+        search_words = set(_WORD_RE.findall(search_title))
+        db_words = set(_WORD_RE.findall(db_title))
         
         if not search_words or not db_words:
             return 0.0
         
-        # Filter out common/meaningless words that shouldn't count for matching
-        # These words are too common and lead to false matches
-        meaningless_words = {
-            'the', 'of', 'and', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 
-            'from', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had',
-            '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'i', 'ii', 'iii', 'iv', 'v',
-            'game', 'edition', 'complete', 'definitive', 'ultimate', 'deluxe', 'premium',
-            'remaster', 'remastered', 'remake', 'hd', 'collection', 'wild', 'new', 'original',
-            'special', 'enhanced', 'director', 'directors', 'gold', 'silver', 'platinum',
-            'standard', 'goty', 'bundle', 'pack', 'set', 'simulator', 'sim', 'magic', 'super',
-            'mega', 'ultra', 'extreme', 'classic', 'legendary', 'epic', 'pro', 'plus', 'max',
-            'mini', 'tiny', 'small', 'big', 'large', 'great', 'grand', 'royal', 'master'
-        }
-        
-        # Also filter out very short words (2 characters or less) as they're too generic
-        # Examples: "MAG", "VI", "XI", etc.
-        short_word_threshold = 3
-        
         # Remove meaningless words and very short words
         meaningful_search_words = {word for word in search_words 
-                                 if word.lower() not in meaningless_words and len(word) >= short_word_threshold}
+                                 if word.lower() not in _MEANINGLESS_WORDS and len(word) >= _SHORT_WORD_THRESHOLD}
         meaningful_db_words = {word for word in db_words 
-                             if word.lower() not in meaningless_words and len(word) >= short_word_threshold}
+                             if word.lower() not in _MEANINGLESS_WORDS and len(word) >= _SHORT_WORD_THRESHOLD}
         
         # If no meaningful words remain, no match
         if not meaningful_search_words or not meaningful_db_words:
@@ -289,13 +386,7 @@ class PriorityGameFilter:
         # Custom sorting: PRIORITY FIRST, then discount as secondary factor
         def sort_key(deal):
             priority = deal.get('_priority', 0)
-            discount_str = deal.get('discount', '0%')
-            
-            # Extract numeric discount value
-            try:
-                discount_num = int(discount_str.replace('%', '')) if discount_str else 0
-            except (ValueError, AttributeError):
-                discount_num = 0
+            discount_num = deal_discount(deal)
             
             # PRIORITY-FIRST sorting: Game priority is the primary factor
             # Secondary factor is discount, but much less important
@@ -342,20 +433,12 @@ class PriorityGameFilter:
         if not self.priority_games:
             return {"total_games": 0, "priority_distribution": {}, "categories": []}
         
-        priority_distribution = {}
-        categories = {}
-        
-        for game in self.priority_games:
-            priority = game.get('priority', 0)
-            category = game.get('category', 'Unknown')
-            
-            priority_distribution[priority] = priority_distribution.get(priority, 0) + 1
-            categories[category] = categories.get(category, 0) + 1
+        categories = dict.fromkeys(game.get('category', 'Unknown') for game in self.priority_games)
         
         return {
             "total_games": len(self.priority_games),
-            "priority_distribution": priority_distribution,
-            "categories": list(categories.keys())
+            "priority_distribution": dict(Counter(self._title_index.priorities)),
+            "categories": list(categories)
         }
 
 
@@ -0,0 +1,79 @@
+# utils/validators.py
+"""
+Shared argument validation for deal commands
+
+validate_discount, validate_method and validate_sort return an error embed
+describing the problem, or None when the argument is acceptable.
+validate_store also normalizes its argument and returns a (store, error_embed)
+tuple.
+"""
+from typing import Optional, Tuple
+
+import discord
+
+from models import canonical_store
+from .embeds import create_error_embed
+
+# Canonical names (see models.STORE_ALIASES) of the stores these commands support
+ALLOWED_STORES = frozenset({'Steam', 'Epic Game Store', 'GOG', 'Microsoft Store'})
+SUPPORTED_STORES_TEXT = "Steam, Epic Game Store, GOG, Xbox/Microsoft Store"
+
+PRIORITY_METHODS = ('hybrid', 'popular_deals', 'waitlisted_deals', 'collected_deals')
+_PRIORITY_METHODS_SET = frozenset(PRIORITY_METHODS)
+
+SORT_METHODS = ('hottest', 'popular', 'newest', 'price', 'discount', 'cut')
+_SORT_METHODS_SET = frozenset(SORT_METHODS)
+
+
+def validate_store(
+    store: Optional[str],
+    prefix: str = "Supported stores"
+) -> Tuple[Optional[str], Optional[discord.Embed]]:
+    """Normalize a store argument, returning (store, error_embed)"""
+    if not store:
+        return None, None
+    store = store.lower().strip()
+    if canonical_store(store) not in ALLOWED_STORES:
+        return store, create_error_embed(
+            "Invalid Store",
+            f"{prefix}: {SUPPORTED_STORES_TEXT}\\n"
+            f"You provided: `{store}`"
+        )
+    return store, None
+
+
+def validate_discount(min_discount: int) -> Optional[discord.Embed]:
+    """Check that a minimum discount is within 0-99"""
+    if 0 <= min_discount <= 99:
+        return None
+    return create_error_embed(
+        "Invalid Discount",
+        f"Discount must be between 0 and 99\\n"
+        f"You provided: `{min_discount}%`"
+    )
+
+
+def validate_method(method: str) -> Optional[discord.Embed]:
+    """Check a native priority method name"""
+    if method.lower() in _PRIORITY_METHODS_SET:
+        return None
+    return create_error_embed(
+        "Invalid Method",
+        f"Valid methods: {', '.join(PRIORITY_METHODS)}\\n"
+        f"You provided: `{method}`\\n\\n"
+        "🔥 **hybrid** - Best overall results (recommended)\\n"
+        "📊 **popular_deals** - Most popular games currently\\n"
+        "💝 **waitlisted_deals** - Most wanted games\\n"
+        "🎮 **collected_deals** - Most owned games"
+    )
+
+
+def validate_sort(sort_by: str) -> Optional[discord.Embed]:
+    """Check a quality deals sort method"""
+    if sort_by.lower() in _SORT_METHODS_SET:
+        return None
+    return create_error_embed(
+        "Invalid Sort Method",
+        f"Valid options: {', '.join(SORT_METHODS)}\\n"
+        f"You provided: `{sort_by}`"
+    )